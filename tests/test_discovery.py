@@ -1,9 +1,11 @@
 """Tests for discovery classes."""
 
+import asyncio
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from ucapi_framework import discovery as discovery_module
 from ucapi_framework.discovery import (
     BaseDiscovery,
     DiscoveredDevice,
@@ -13,6 +15,18 @@ from ucapi_framework.discovery import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_discovery_loaders():
+    """Reset cached optional-dependency imports so each test sees its own mocks."""
+    for loader in (
+        discovery_module._load_ssdpy,
+        discovery_module._load_sddp,
+        discovery_module._load_zeroconf,
+    ):
+        loader.cache_clear()
+    yield
+
+
 class TestDiscoveredDevice:
     """Tests for DiscoveredDevice dataclass."""
 
@@ -53,6 +67,12 @@ class TestDiscoveredDevice:
 
         assert device.extra_data is None
 
+    def test_discovered_device_uses_slots(self):
+        """Test that DiscoveredDevice does not carry a per-instance __dict__."""
+        device = DiscoveredDevice("dev-1", "Device", "192.168.1.1")
+
+        assert not hasattr(device, "__dict__")
+
 
 class ConcreteDiscovery(BaseDiscovery):
     """Concrete implementation for testing."""
@@ -129,6 +149,46 @@ class TestBaseDiscovery:
         discovery.clear()
         assert discovery.devices == []
 
+    @pytest.mark.asyncio
+    async def test_fetch_descriptor_revalidates_with_etag(self):
+        """Test descriptor fetches reuse the cached body on 304 Not Modified."""
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        requests = []
+
+        async def handler(request):
+            requests.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return web.Response(status=304)
+            return web.Response(body=b"<root/>", headers={"ETag": '"v1"'})
+
+        app = web.Application()
+        app.router.add_get("/description.xml", handler)
+
+        async with TestServer(app) as server:
+            discovery = ConcreteDiscovery()
+            url = str(server.make_url("/description.xml"))
+            try:
+                first = await discovery._fetch_descriptor(url)
+                second = await discovery._fetch_descriptor(url)
+            finally:
+                await discovery.close()
+
+        assert first == second == b"<root/>"
+        assert requests == [None, '"v1"']
+        assert discovery._http_session is None
+
+    @pytest.mark.asyncio
+    async def test_discover_stream_default(self):
+        """Test default discover_stream yields the results of discover()."""
+        discovery = ConcreteDiscovery()
+
+        devices = [device async for device in discovery.discover_stream()]
+
+        assert discovery.discover_called is True
+        assert [d.identifier for d in devices] == ["dev1", "dev2"]
+
 
 class ConcreteSSDPDiscovery(SSDPDiscovery):
     """Concrete SSDP discovery for testing."""
@@ -193,6 +253,44 @@ class TestSSDPDiscovery:
             assert devices[0].identifier == "uuid:device-1"
             assert devices[0].name == "Test Device 1"
 
+    @pytest.mark.asyncio
+    async def test_discover_async_parse_hook_closes_session(self):
+        """Test async_parse_ssdp_device can fetch descriptors; the session is closed."""
+
+        class DescriptorSSDPDiscovery(ConcreteSSDPDiscovery):
+            async def async_parse_ssdp_device(self, raw_device):
+                device = self.parse_ssdp_device(raw_device)
+                xml = await self._fetch_descriptor(raw_device["location"])
+                device.name = xml.decode()
+                return device
+
+        mock_ssdp_client = Mock()
+        mock_ssdp_client.m_search.return_value = [
+            {
+                "usn": "uuid:device-1",
+                "server": "Test Device 1",
+                "location": "http://192.168.1.100:8080/description.xml",
+            },
+        ]
+        mock_ssdpy_module = Mock()
+        mock_ssdpy_module.SSDPClient.return_value = mock_ssdp_client
+
+        with patch.dict("sys.modules", {"ssdpy": mock_ssdpy_module}):
+            discovery = DescriptorSSDPDiscovery()
+            with (
+                patch.object(
+                    discovery,
+                    "_fetch_descriptor",
+                    AsyncMock(return_value=b"Living Room"),
+                ) as fetch,
+                patch.object(discovery, "close", AsyncMock()) as close,
+            ):
+                devices = await discovery.discover()
+
+        fetch.assert_awaited_once_with("http://192.168.1.100:8080/description.xml")
+        assert devices[0].name == "Living Room"
+        close.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_discover_with_filter(self):
         """Test SSDP discovery with device filter."""
@@ -225,6 +323,71 @@ class TestSSDPDiscovery:
             assert len(devices) == 1
             assert devices[0].name == "Test Device 1"
 
+    @pytest.mark.asyncio
+    async def test_discover_normalizes_header_names(self):
+        """Test SSDP header names are lowercased before filtering and parsing."""
+        mock_ssdp_client = Mock()
+        mock_ssdp_client.m_search.return_value = [
+            {
+                "USN": "uuid:device-1",
+                "Server": "Test Device 1",
+                "LOCATION": "http://192.168.1.100:8080/description.xml",
+                "NTS": "ssdp:alive",
+            },
+        ]
+
+        mock_ssdpy_module = Mock()
+        mock_ssdpy_module.SSDPClient.return_value = mock_ssdp_client
+
+        seen = []
+
+        def device_filter(raw_device):
+            seen.append(raw_device)
+            return True
+
+        with patch.dict("sys.modules", {"ssdpy": mock_ssdpy_module}):
+            discovery = ConcreteSSDPDiscovery(device_filter=device_filter)
+            devices = await discovery.discover()
+
+        assert devices[0].identifier == "uuid:device-1"
+        assert devices[0].address == "192.168.1.100"
+        assert set(seen[0]) == {"usn", "server", "location", "nts"}
+
+    @pytest.mark.asyncio
+    async def test_discover_with_header_filter(self):
+        """Test SSDP discovery with a header mapping as device filter."""
+        mock_ssdp_client = Mock()
+        mock_ssdp_client.m_search.return_value = [
+            {
+                "usn": "uuid:device-1",
+                "st": "urn:schemas-upnp-org:device:ZonePlayer:1",
+                "server": "Linux UPnP/1.0 Sonos/70.3",
+                "location": "http://192.168.1.100:1400/xml/device_description.xml",
+            },
+            {
+                "usn": "uuid:device-2",
+                "st": "urn:schemas-upnp-org:device:MediaRenderer:1",
+                "server": "Linux UPnP/1.0 Sonos/70.3",
+                "location": "http://192.168.1.101:1400/xml/device_description.xml",
+            },
+            {
+                "usn": "uuid:device-3",
+                "location": "http://192.168.1.102:8080/description.xml",
+            },
+        ]
+
+        mock_ssdpy_module = Mock()
+        mock_ssdpy_module.SSDPClient.return_value = mock_ssdp_client
+
+        with patch.dict("sys.modules", {"ssdpy": mock_ssdpy_module}):
+            discovery = ConcreteSSDPDiscovery(
+                device_filter={"SERVER": "Sonos", "st": "ZonePlayer"}
+            )
+            devices = await discovery.discover()
+
+        assert [d.identifier for d in devices] == ["uuid:device-1"]
+        assert discovery.device_filter == {"SERVER": "Sonos", "st": "ZonePlayer"}
+
     @pytest.mark.asyncio
     async def test_discover_handles_import_error(self):
         """Test that discover handles missing ssdpy gracefully."""
@@ -241,6 +404,47 @@ class TestSSDPDiscovery:
             # Should return empty list on import error
             assert devices == []
 
+    @pytest.mark.asyncio
+    async def test_discover_stream(self):
+        """Test SSDP discover_stream yields parsed devices one by one."""
+        mock_ssdp_client = Mock()
+        mock_ssdp_client.m_search.return_value = [
+            {
+                "usn": "uuid:device-1",
+                "server": "Test Device 1",
+                "location": "http://192.168.1.100:8080/description.xml",
+            },
+            {"usn": "uuid:broken", "location": "invalid"},
+        ]
+
+        mock_ssdpy_module = Mock()
+        mock_ssdpy_module.SSDPClient.return_value = mock_ssdp_client
+
+        with patch.dict("sys.modules", {"ssdpy": mock_ssdpy_module}):
+            discovery = ConcreteSSDPDiscovery()
+            devices = [device async for device in discovery.discover_stream()]
+
+        # Unparseable responses are skipped
+        assert [d.identifier for d in devices] == ["uuid:device-1"]
+        assert discovery.devices == devices
+
+    @pytest.mark.asyncio
+    async def test_ssdpy_import_is_cached(self):
+        """Test that the ssdpy client class is resolved once across runs."""
+        mock_ssdpy_module = Mock()
+        mock_ssdpy_module.SSDPClient.return_value.m_search.return_value = []
+
+        with patch.dict("sys.modules", {"ssdpy": mock_ssdpy_module}):
+            discovery = ConcreteSSDPDiscovery()
+            await discovery.discover()
+
+        # ssdpy is no longer importable, but the cached class is reused
+        with patch.dict("sys.modules", {"ssdpy": None}):
+            devices = await discovery.discover()
+
+        assert devices == []
+        assert mock_ssdpy_module.SSDPClient.call_count == 2
+
 
 class ConcreteSDDPDiscovery(SDDPDiscovery):
     """Concrete SDDP discovery for testing."""
@@ -474,6 +678,109 @@ class TestMDNSDiscovery:
             # Due to asyncio sleep and mocking complexity, this is more of a structure test
             assert isinstance(devices, list)
 
+    @pytest.mark.asyncio
+    async def test_zeroconf_closed_after_each_discovery(self):
+        """Test every discovery run creates and closes its own Zeroconf instance."""
+        mock_zeroconfs = [Mock(), Mock()]
+        mock_browsers = [Mock(), Mock()]
+
+        mock_zeroconf_module = Mock()
+        mock_zeroconf_module.Zeroconf.side_effect = mock_zeroconfs
+        mock_zeroconf_module.ServiceBrowser.side_effect = mock_browsers
+
+        with patch.dict("sys.modules", {"zeroconf": mock_zeroconf_module}):
+            await ConcreteMDNSDiscovery(
+                service_type="_http._tcp.local.", timeout=0.01
+            ).discover()
+            await ConcreteMDNSDiscovery(
+                service_type="_airplay._tcp.local.", timeout=0.01
+            ).discover()
+
+        for zeroconf, browser in zip(mock_zeroconfs, mock_browsers):
+            browser.cancel.assert_called_once()
+            zeroconf.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_discover_stream_yields_before_timeout(self):
+        """Test mDNS discover_stream yields services as the browser reports them."""
+        mock_service_info = Mock()
+        mock_service_info.name = "test-device._test._tcp.local."
+        mock_service_info.server = "Test Device"
+        mock_service_info.addresses = ["192.168.1.100"]
+        mock_service_info.port = 8080
+
+        mock_zeroconf = Mock()
+        mock_zeroconf.get_service_info.return_value = mock_service_info
+
+        mock_zeroconf_module = Mock()
+        mock_zeroconf_module.Zeroconf.return_value = mock_zeroconf
+        mock_zeroconf_module.ServiceListener = object
+
+        def browser_reports_service(zc, service_type, listener):
+            listener.add_service(zc, service_type, mock_service_info.name)
+            return Mock()
+
+        mock_zeroconf_module.ServiceBrowser.side_effect = browser_reports_service
+
+        with patch.dict("sys.modules", {"zeroconf": mock_zeroconf_module}):
+            discovery = ConcreteMDNSDiscovery(
+                service_type="_test._tcp.local.", timeout=30
+            )
+            stream = discovery.discover_stream()
+            device = await asyncio.wait_for(anext(stream), timeout=1)
+            await stream.aclose()
+
+        assert device.identifier == "test-device._test._tcp.local."
+        assert device.address == "192.168.1.100"
+
+    @pytest.mark.asyncio
+    async def test_browser_cancelled_when_discovery_cancelled(self):
+        """Test the service browser is cancelled if discovery is interrupted."""
+        mock_browser = Mock()
+
+        mock_zeroconf_module = Mock()
+        mock_zeroconf_module.ServiceBrowser.return_value = mock_browser
+
+        with patch.dict("sys.modules", {"zeroconf": mock_zeroconf_module}):
+            discovery = ConcreteMDNSDiscovery(
+                service_type="_test._tcp.local.", timeout=30
+            )
+            with pytest.raises(TimeoutError):
+                await asyncio.wait_for(discovery.discover(), timeout=0.05)
+
+        mock_browser.cancel.assert_called_once()
+        mock_zeroconf_module.Zeroconf.return_value.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_quiet_period_ends_discovery_early(self):
+        """Test mDNS discovery stops once no new services arrive in the quiet period."""
+        mock_service_info = Mock()
+        mock_service_info.name = "test-device._test._tcp.local."
+        mock_service_info.server = "Test Device"
+        mock_service_info.addresses = ["192.168.1.100"]
+        mock_service_info.port = 8080
+
+        mock_zeroconf = Mock()
+        mock_zeroconf.get_service_info.return_value = mock_service_info
+
+        mock_zeroconf_module = Mock()
+        mock_zeroconf_module.Zeroconf.return_value = mock_zeroconf
+        mock_zeroconf_module.ServiceListener = object
+
+        def browser_reports_service(zc, service_type, listener):
+            listener.add_service(zc, service_type, mock_service_info.name)
+            return Mock()
+
+        mock_zeroconf_module.ServiceBrowser.side_effect = browser_reports_service
+
+        with patch.dict("sys.modules", {"zeroconf": mock_zeroconf_module}):
+            discovery = ConcreteMDNSDiscovery(
+                service_type="_test._tcp.local.", timeout=30, quiet_period=0.05
+            )
+            devices = await asyncio.wait_for(discovery.discover(), timeout=1)
+
+        assert len(devices) == 1
+
 
 class TestNetworkScanDiscovery:
     """Tests for NetworkScanDiscovery."""
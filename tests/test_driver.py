@@ -1,15 +1,16 @@
 """Tests for BaseIntegrationDriver."""
 
 import asyncio
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 import ucapi
-from ucapi import media_player
+from ucapi import button, media_player, remote, sensor
 
 from ucapi_framework.device import BaseDeviceInterface, DeviceEvents
 from ucapi_framework.driver import BaseIntegrationDriver, create_entity_id, EntitySource
+from ucapi_framework import driver as driver_module
 from ucapi import EntityTypes
 
 
@@ -208,6 +209,47 @@ class TestBaseIntegrationDriver:
         assert driver._entity_classes == [media_player.MediaPlayer]
         assert driver._configured_devices == {}
 
+    def test_registers_remote_event_handlers(self, mock_loop):
+        """Test every Remote Two event is wired to its driver handler."""
+        with patch.object(ucapi.IntegrationAPI, "add_listener") as add_listener:
+            driver = ConcreteDriver(
+                DeviceForTests, [media_player.MediaPlayer], loop=mock_loop
+            )
+
+        registered = {
+            call.args[0]: call.args[1] for call in add_listener.call_args_list
+        }
+        assert registered == {
+            ucapi.Events.CONNECT: driver.on_r2_connect_cmd,
+            ucapi.Events.DISCONNECT: driver.on_r2_disconnect_cmd,
+            ucapi.Events.ENTER_STANDBY: driver.on_r2_enter_standby,
+            ucapi.Events.EXIT_STANDBY: driver.on_r2_exit_standby,
+            ucapi.Events.SUBSCRIBE_ENTITIES: driver.on_subscribe_entities,
+            ucapi.Events.UNSUBSCRIBE_ENTITIES: driver.on_unsubscribe_entities,
+        }
+
+    def test_core_attributes_use_slots(self, mock_loop):
+        """Test core driver attributes are stored in slots, not the instance dict."""
+        driver = ConcreteDriver(
+            DeviceForTests, [media_player.MediaPlayer], loop=mock_loop
+        )
+
+        assert "_configured_devices" not in vars(driver)
+        assert "api" not in vars(driver)
+        # Subclasses without __slots__ can still set arbitrary attributes
+        driver.custom_attribute = "value"
+        assert driver.custom_attribute == "value"
+
+    def test_base_driver_has_no_instance_dict(self, mock_loop):
+        """Test the base driver itself keeps no per-instance __dict__."""
+        driver = BaseIntegrationDriver(
+            DeviceForTests, [media_player.MediaPlayer], loop=mock_loop
+        )
+
+        assert not hasattr(driver, "__dict__")
+        with pytest.raises(AttributeError):
+            driver.custom_attribute = "value"
+
     @pytest.mark.asyncio
     async def test_on_r2_connect_cmd(self):
         """Test Remote Two connect command."""
@@ -246,6 +288,66 @@ class TestBaseIntegrationDriver:
         if pending:
             await asyncio.wait(pending, timeout=0.1)
 
+    @pytest.mark.asyncio
+    async def test_on_r2_connect_cmd_limits_concurrent_connects(self):
+        """Test Remote Two connect command bounds the number of concurrent connects."""
+        loop = asyncio.get_event_loop()
+        driver = ConcreteDriver(DeviceForTests, [media_player.MediaPlayer], loop=loop)
+        driver.api = MagicMock()
+        driver.api.set_device_state = AsyncMock()
+
+        active = 0
+        max_active = 0
+        release = asyncio.Event()
+
+        async def slow_connect():
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await release.wait()
+            active -= 1
+            return True
+
+        for index in range(12):
+            device = MagicMock()
+            device.connect = slow_connect
+            driver._configured_devices[f"dev{index}"] = device
+
+        await driver.on_r2_connect_cmd()
+        await asyncio.sleep(0.01)
+
+        assert max_active == driver_module._MAX_CONCURRENT_CONNECTS
+
+        release.set()
+        await asyncio.sleep(0.01)
+        assert active == 0
+
+    @pytest.mark.asyncio
+    async def test_on_r2_connect_cmd_single_task_logs_failures(self, caplog):
+        """Test connect runs as one tracked task and logs failing devices."""
+        loop = asyncio.get_event_loop()
+        driver = ConcreteDriver(DeviceForTests, [media_player.MediaPlayer], loop=loop)
+        driver.api = MagicMock()
+        driver.api.set_device_state = AsyncMock()
+
+        for index in range(3):
+            device = MagicMock()
+            device.identifier = f"dev{index}"
+            device.connect = AsyncMock(
+                side_effect=OSError("unreachable") if index == 1 else None
+            )
+            driver._configured_devices[device.identifier] = device
+
+        await driver.on_r2_connect_cmd()
+        assert len(driver._background_tasks) == 1
+
+        await asyncio.sleep(0.01)
+
+        assert not driver._background_tasks
+        for device in driver._configured_devices.values():
+            device.connect.assert_awaited_once()
+        assert "Failed to connect device dev1: unreachable" in caplog.text
+
     @pytest.mark.asyncio
     async def test_on_r2_disconnect_cmd(self):
         """Test Remote Two disconnect command."""
@@ -298,6 +400,47 @@ class TestBaseIntegrationDriver:
         assert dev1.is_connected is False
         assert dev2.is_connected is False
 
+    @pytest.mark.asyncio
+    async def test_on_r2_enter_standby_failure_isolated(self, driver):
+        """Test a failing disconnect does not prevent other devices from disconnecting."""
+        config1 = DeviceConfigForTests("dev1", "Device 1", "192.168.1.1")
+        config2 = DeviceConfigForTests("dev2", "Device 2", "192.168.1.2")
+        driver.add_configured_device(config1, connect=False)
+        driver.add_configured_device(config2, connect=False)
+
+        dev1 = driver._configured_devices["dev1"]
+        dev2 = driver._configured_devices["dev2"]
+        await dev2.connect()
+        dev1.disconnect = AsyncMock(side_effect=OSError("socket closed"))
+
+        await driver.on_r2_enter_standby()
+
+        dev1.disconnect.assert_awaited_once()
+        assert dev2.is_connected is False
+
+    @pytest.mark.asyncio
+    async def test_on_r2_enter_standby_limits_concurrent_disconnects(self, driver):
+        """Test entering standby bounds the number of concurrent disconnects."""
+        active = 0
+        max_active = 0
+
+        async def slow_disconnect():
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        for index in range(12):
+            device = MagicMock()
+            device.disconnect = slow_disconnect
+            driver._configured_devices[f"dev{index}"] = device
+
+        await driver.on_r2_enter_standby()
+
+        assert max_active == driver_module._MAX_CONCURRENT_CONNECTS
+        assert active == 0
+
     @pytest.mark.asyncio
     async def test_on_r2_exit_standby(self):
         """Test exiting standby mode."""
@@ -384,6 +527,37 @@ class TestBaseIntegrationDriver:
         assert "dev1" not in driver._configured_devices
         assert device.is_connected is False
 
+    @pytest.mark.asyncio
+    async def test_on_unsubscribe_entities_checks_each_device_once(self, driver):
+        """Test a device referenced by several entities is only cleaned up once."""
+        config = DeviceConfigForTests("dev1", "Device 1", "192.168.1.1")
+        driver.add_configured_device(config, connect=False)
+        device = driver._configured_devices["dev1"]
+        device.disconnect = AsyncMock()
+        driver.api.configured_entities.get.return_value = None
+
+        await driver.on_unsubscribe_entities(
+            ["media_player.dev1", "remote.dev1", "media_player.unknown"]
+        )
+
+        device.disconnect.assert_awaited_once()
+        assert "dev1" not in driver._configured_devices
+
+    @pytest.mark.asyncio
+    async def test_on_unsubscribe_entities_skips_malformed_id(self, driver, caplog):
+        """Test a malformed entity ID is logged and skipped on unsubscribe."""
+        config = DeviceConfigForTests("dev1", "Device 1", "192.168.1.1")
+        driver.add_configured_device(config, connect=False)
+        device = driver._configured_devices["dev1"]
+        device.disconnect = AsyncMock()
+        driver.api.configured_entities.get.return_value = None
+
+        await driver.on_unsubscribe_entities(["malformed", "media_player.dev1"])
+
+        assert "Skipping unsubscription of entity malformed" in caplog.text
+        device.disconnect.assert_awaited_once()
+        assert "dev1" not in driver._configured_devices
+
     def test_add_configured_device(self, driver):
         """Test adding a configured device."""
         config = DeviceConfigForTests("dev1", "Device 1", "192.168.1.1")
@@ -470,6 +644,94 @@ class TestBaseIntegrationDriver:
         assert driver._configured_devices["dev1"].is_connected is True
         assert driver._configured_devices["dev2"].is_connected is True
 
+    @pytest.mark.asyncio
+    async def test_register_all_configured_devices_isolates_failures(
+        self, mock_loop, caplog
+    ):
+        """Test one failing device does not stop the others from being added."""
+        driver = ConcreteDriver(
+            DeviceForTests,
+            [media_player.MediaPlayer],
+            require_connection_before_registry=True,
+            loop=mock_loop,
+        )
+        driver.api = MagicMock()
+        driver.api.configured_entities = MagicMock()
+        driver.api.available_entities = MockEntityCollection()
+
+        config1 = DeviceConfigForTests("dev1", "Device 1", "192.168.1.1")
+        config2 = DeviceConfigForTests("dev2", "Device 2", "192.168.1.2")
+        mock_config_manager = MagicMock()
+        mock_config_manager.all.return_value = [config1, config2]
+        driver.config_manager = mock_config_manager
+
+        original_add = driver.async_add_configured_device
+
+        async def add(device_config):
+            if device_config.identifier == "dev1":
+                raise RuntimeError("boom")
+            return await original_add(device_config)
+
+        driver.async_add_configured_device = add
+
+        await driver.register_all_configured_devices()
+
+        assert driver._configured_devices["dev2"].is_connected is True
+        assert "Failed to add device dev1: boom" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_register_all_configured_devices_gates_only_connect(self, mock_loop):
+        """Test entity registration does not hold the connect limit."""
+        driver = ConcreteDriver(
+            DeviceForTests,
+            [media_player.MediaPlayer],
+            require_connection_before_registry=True,
+            loop=mock_loop,
+        )
+        driver.api = MagicMock()
+        driver.api.configured_entities = MagicMock()
+        driver.api.available_entities = MockEntityCollection()
+        driver._connect_semaphore = asyncio.Semaphore(1)
+
+        mock_config_manager = MagicMock()
+        mock_config_manager.all.return_value = [
+            DeviceConfigForTests("dev1", "Device 1", "192.168.1.1")
+        ]
+        driver.config_manager = mock_config_manager
+
+        locked_during_registration = []
+
+        async def register(device_config, device):
+            locked_during_registration.append(driver._connect_semaphore.locked())
+
+        driver.async_register_available_entities = register
+
+        await driver.register_all_configured_devices()
+
+        assert locked_during_registration == [False]
+
+    @pytest.mark.asyncio
+    async def test_register_all_configured_devices_logs_unresolvable_config(
+        self, mock_loop, caplog
+    ):
+        """Test the original error is logged when the device ID cannot be resolved."""
+        driver = ConcreteDriver(
+            DeviceForTests,
+            [media_player.MediaPlayer],
+            require_connection_before_registry=True,
+            loop=mock_loop,
+        )
+        driver.api = MagicMock()
+
+        mock_config_manager = MagicMock()
+        mock_config_manager.all.return_value = [object()]
+        driver.config_manager = mock_config_manager
+
+        await driver.register_all_configured_devices()
+
+        assert "Failed to add device <object object at" in caplog.text
+        assert "has no 'identifier', 'id', or 'device_id' attribute" in caplog.text
+
     @pytest.mark.asyncio
     async def test_register_all_configured_devices_with_no_config_manager(
         self, mock_loop, caplog
@@ -522,6 +784,11 @@ class TestBaseIntegrationDriver:
         # Device should be registered
         assert "dev1" in driver._configured_devices
 
+        # The background connection task is named and referenced by the driver
+        assert [task.get_name() for task in driver._background_tasks] == [
+            "connect:dev1"
+        ]
+
         # Give the background connection task time to run
         await asyncio.sleep(0.05)
 
@@ -706,6 +973,48 @@ class TestBaseIntegrationDriver:
 
         assert address == "192.168.1.1"
 
+    def test_get_device_id_keeps_attribute_order_per_instance(self, driver):
+        """Test cached attribute resolution still honours per-instance values."""
+
+        @dataclass
+        class DualIdConfig:
+            identifier: str
+            id: str
+
+        assert driver.get_device_id(DualIdConfig("", "fallback")) == "fallback"
+        assert driver.get_device_id(DualIdConfig("primary", "fallback")) == "primary"
+
+    def test_get_device_id_instance_attribute_precedence(self, driver):
+        """Test an earlier instance attribute wins over a later dataclass field."""
+
+        @dataclass
+        class IdOnlyConfig:
+            id: str
+
+        config = IdOnlyConfig("field")
+        config.identifier = "instance"
+
+        assert driver.get_device_id(config) == "instance"
+
+    def test_get_device_id_conditionally_set_attribute(self, driver):
+        """Test an attribute missing on the first instance is found on later ones."""
+
+        @dataclass
+        class ConditionalIdConfig:
+            name: str
+            identifier: str = field(init=False)
+
+        first = ConditionalIdConfig("first")
+        second = ConditionalIdConfig("second")
+        second.identifier = "dev2"
+        undeclared = ConditionalIdConfig("third")
+        undeclared.device_id = "dev3"
+
+        with pytest.raises(AttributeError):
+            driver.get_device_id(first)
+        assert driver.get_device_id(second) == "dev2"
+        assert driver.get_device_id(undeclared) == "dev3"
+
     def test_remove_device(self, driver):
         """Test removing a device."""
         config = DeviceConfigForTests("dev1", "Device 1", "192.168.1.1")
@@ -947,6 +1256,123 @@ class TestBaseIntegrationDriver:
 
         assert entity_ids == ["media_player.dev1"]
 
+    def test_get_entity_ids_for_device_scan_parses_each_id_once(self, driver):
+        """Test the fallback scan parses IDs shared by both collections once."""
+        shared = {"entity_id": "media_player.dev9"}
+        driver.api.available_entities.get_all = MagicMock(
+            return_value=[shared, {"entity_id": "light.other"}]
+        )
+        driver.api.configured_entities.get_all = MagicMock(return_value=[shared])
+
+        with patch.object(
+            driver, "device_from_entity_id", wraps=driver.device_from_entity_id
+        ) as parse:
+            entity_ids = driver.get_entity_ids_for_device("dev9")
+
+        assert entity_ids == ["media_player.dev9"]
+        # ConcreteDriver overrides device_from_entity_id, so no prefilter applies
+        assert sorted(call.args[0] for call in parse.call_args_list) == [
+            "light.other",
+            "media_player.dev9",
+        ]
+
+    def test_get_entity_ids_for_device_scan_standard_format(self, mock_loop):
+        """Test the fallback scan matches the device field without parsing."""
+
+        class StandardParsingDriver(ConcreteDriver):
+            device_from_entity_id = BaseIntegrationDriver.device_from_entity_id
+
+        driver = StandardParsingDriver(
+            DeviceForTests, [media_player.MediaPlayer], loop=mock_loop
+        )
+        driver.api.available_entities.get_all = MagicMock(
+            return_value=[
+                {"entity_id": "light.dev1"},
+                {"entity_id": "light.dev1.zone"},
+                {"entity_id": "light.dev10"},
+                {"entity_id": "light.hub.dev1"},
+                {"entity_id": "dev1"},
+            ]
+        )
+        driver.api.configured_entities.get_all = MagicMock(
+            return_value=[{"entity_id": "light.dev1"}]
+        )
+
+        with patch.object(driver, "device_from_entity_id") as parse:
+            entity_ids = driver.get_entity_ids_for_device("dev1")
+
+        assert entity_ids == ["light.dev1", "light.dev1.zone"]
+        parse.assert_not_called()
+
+    def test_get_entity_ids_for_device_mixed_registration(self, driver):
+        """Test entities added straight to the API are found after add_entity."""
+        driver.api.available_entities = ucapi.entities.Entities("available", None)
+        driver.api.configured_entities = ucapi.entities.Entities("configured", None)
+        for name in ("a", "b", "c"):
+            driver.api.available_entities.add(
+                ucapi.Light(
+                    f"light.hub.{name}", name, [ucapi.light.Features.ON_OFF], {}
+                )
+            )
+
+        driver.add_entity(
+            ucapi.Light("light.hub.new", "new", [ucapi.light.Features.ON_OFF], {})
+        )
+
+        assert sorted(driver.get_entity_ids_for_device("hub")) == [
+            "light.hub.a",
+            "light.hub.b",
+            "light.hub.c",
+            "light.hub.new",
+        ]
+
+    def test_get_entity_ids_for_device_includes_direct_api_additions(self, driver):
+        """Test entities added to the API after registration are found and removed."""
+        driver.api.available_entities = ucapi.entities.Entities("available", None)
+        driver.api.configured_entities = ucapi.entities.Entities("configured", None)
+        config = DeviceConfigForTests("dev1", "Device 1", "192.168.1.1")
+        driver.add_configured_device(config, connect=False)
+
+        driver.api.available_entities.add(
+            ucapi.Light("light.dev1.zone", "Zone", [ucapi.light.Features.ON_OFF], {})
+        )
+
+        assert driver.get_entity_ids_for_device("dev1") == [
+            "media_player.dev1",
+            "light.dev1.zone",
+        ]
+
+        driver.remove_device("dev1")
+
+        assert driver.api.available_entities.get("light.dev1.zone") is None
+
+    def test_get_entity_ids_for_device_overridden_registration(self, mock_loop):
+        """Test entities added by an overridden registration hook are found."""
+
+        class HubDriver(ConcreteDriver):
+            def register_available_entities(self, device_config, device):
+                super().register_available_entities(device_config, device)
+                self.api.available_entities.add(
+                    ucapi.Light(
+                        f"light.{device_config.identifier}.extra",
+                        "Extra",
+                        [ucapi.light.Features.ON_OFF],
+                        {},
+                    )
+                )
+
+        driver = HubDriver(DeviceForTests, [media_player.MediaPlayer], loop=mock_loop)
+        driver.api = MagicMock()
+        driver.api.available_entities = ucapi.entities.Entities("available", None)
+        driver.api.configured_entities = ucapi.entities.Entities("configured", None)
+        config = DeviceConfigForTests("dev1", "Device 1", "192.168.1.1")
+        driver.add_configured_device(config, connect=False)
+
+        assert driver.get_entity_ids_for_device("dev1") == [
+            "media_player.dev1",
+            "light.dev1.extra",
+        ]
+
     def test_map_device_state(self, driver):
         """Test mapping device state to media player state."""
         assert driver.map_device_state("playing") == media_player.States.PLAYING
@@ -1388,6 +1814,32 @@ class TestHubBasedIntegration:
         assert "dev1" in driver._configured_devices
         device = driver._configured_devices["dev1"]
         assert device.is_connected is True
+        # The device config is looked up only once
+        driver.config_manager.get.assert_called_once_with("dev1")
+
+    @pytest.mark.asyncio
+    async def test_on_subscribe_entities_hub_based_skips_malformed_id(self):
+        """Test one malformed entity ID does not abort a hub subscription."""
+        loop = asyncio.get_event_loop()
+        driver = ConcreteDriver(
+            DeviceForTests,
+            [media_player.MediaPlayer],
+            require_connection_before_registry=True,
+            loop=loop,
+        )
+        driver.api = MagicMock()
+        driver.api.configured_entities = MagicMock()
+        driver.api.available_entities = MockEntityCollection()
+        driver.config_manager = MagicMock()
+        driver.config_manager.get = MagicMock(
+            return_value=DeviceConfigForTests("dev1", "Device 1", "192.168.1.1")
+        )
+        driver.refresh_entity_state = AsyncMock()
+
+        await driver.on_subscribe_entities(["malformed", "media_player.dev1"])
+
+        assert driver._configured_devices["dev1"].is_connected is True
+        driver.refresh_entity_state.assert_awaited_once_with("media_player.dev1")
 
     @pytest.mark.asyncio
     async def test_on_subscribe_entities_hub_based_existing_disconnected_device(self):
@@ -1472,8 +1924,16 @@ class TestHubBasedIntegration:
 
         config = DeviceConfigForTests("dev1", "Device 1", "192.168.1.1")
 
-        # Call on_device_added
-        driver.on_device_added(config)
+        # Call on_device_added; the device ID is only resolved inside the task
+        with patch.object(
+            driver, "get_device_id", wraps=driver.get_device_id
+        ) as get_device_id:
+            driver.on_device_added(config)
+            get_device_id.assert_not_called()
+
+        # The background task is referenced until it completes
+        assert len(driver._background_tasks) == 1
+        assert next(iter(driver._background_tasks)).get_name() == "add_device"
 
         # Give the background task time to run
         await asyncio.sleep(0.1)
@@ -1482,6 +1942,7 @@ class TestHubBasedIntegration:
         assert "dev1" in driver._configured_devices
         device = driver._configured_devices["dev1"]
         assert device.is_connected is True
+        assert not driver._background_tasks
 
 
 class TestAsyncDeviceMethods:
@@ -1507,6 +1968,27 @@ class TestAsyncDeviceMethods:
         # Check entities were registered
         assert len(driver.api.available_entities._entities) > 0
 
+    @pytest.mark.asyncio
+    async def test_async_add_configured_device_resolves_device_id_once(self):
+        """Test async_add_configured_device reuses the resolved device id."""
+        loop = asyncio.get_event_loop()
+        driver = ConcreteDriver(DeviceForTests, [media_player.MediaPlayer], loop=loop)
+        driver.api = MagicMock()
+        driver.api.configured_entities = MagicMock()
+        driver.api.available_entities = MockEntityCollection()
+        driver.api.set_device_state = AsyncMock()
+        driver.register_available_entities = MagicMock()
+
+        config = DeviceConfigForTests("dev1", "Device 1", "192.168.1.1")
+
+        with patch.object(
+            driver, "get_device_id", wraps=driver.get_device_id
+        ) as mock_get_id:
+            result = await driver.async_add_configured_device(config)
+
+        assert result is True
+        mock_get_id.assert_called_once_with(config)
+
     @pytest.mark.asyncio
     async def test_async_add_configured_device_failure(self):
         """Test async_add_configured_device fails when device doesn't connect."""
@@ -1619,6 +2101,58 @@ class TestAsyncDeviceMethods:
 
         assert result is False
 
+    @pytest.mark.asyncio
+    async def test_ensure_device_connected_backoff(self):
+        """Test _ensure_device_connected backs off exponentially between attempts."""
+        loop = asyncio.get_event_loop()
+        driver = ConcreteDriver(DeviceForTests, [media_player.MediaPlayer], loop=loop)
+        driver.api = MagicMock()
+
+        config = DeviceConfigForTests("dev1", "Device 1", "192.168.1.1")
+        driver._add_device_instance(config)
+        device = driver._configured_devices["dev1"]
+        device.connect = AsyncMock(return_value=False)
+
+        with (
+            patch("ucapi_framework.driver.asyncio.sleep", new=AsyncMock()) as sleep,
+            patch("ucapi_framework.driver.random.uniform", return_value=0.05),
+        ):
+            result = await driver._ensure_device_connected("dev1")
+
+        assert result is False
+        assert device.connect.await_count == 3
+        # No sleep after the final attempt
+        assert [c.args[0] for c in sleep.await_args_list] == [0.3, 0.55]
+
+    @pytest.mark.asyncio
+    async def test_ensure_device_connected_bounds_slow_disconnect(self):
+        """Test a hanging disconnect between attempts does not stall the retries."""
+        loop = asyncio.get_event_loop()
+        driver = ConcreteDriver(DeviceForTests, [media_player.MediaPlayer], loop=loop)
+        driver.api = MagicMock()
+
+        config = DeviceConfigForTests("dev1", "Device 1", "192.168.1.1")
+        driver._add_device_instance(config)
+        device = driver._configured_devices["dev1"]
+        device.connect = AsyncMock(side_effect=[False, True])
+
+        async def hanging_disconnect():
+            await asyncio.sleep(10)
+
+        device.disconnect = hanging_disconnect
+
+        with (
+            patch.object(driver_module, "_CONNECT_RETRY_DISCONNECT_TIMEOUT", 0.01),
+            patch.object(driver_module, "_CONNECT_RETRY_BASE_DELAY", 0),
+            patch.object(driver_module, "_CONNECT_RETRY_JITTER", 0),
+        ):
+            result = await asyncio.wait_for(
+                driver._ensure_device_connected("dev1"), timeout=1
+            )
+
+        assert result is True
+        assert device.connect.await_count == 2
+
 
 class TestAsyncRegisterEntities:
     """Tests for async_register_available_entities."""
@@ -1825,6 +2359,42 @@ class TestRefreshEntityState:
 
         driver.api.configured_entities.update_attributes.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_refresh_entity_state_ir_emitter_uses_remote_state(self):
+        """Test refresh_entity_state maps IR emitter entities to the remote STATE attribute."""
+        driver = self._create_driver()
+        config = DeviceConfigForTests("dev1", "Device 1", "192.168.1.1")
+        driver.add_configured_device(config, connect=False)
+        device = driver._configured_devices["dev1"]
+        await device.connect()
+        device._state = "on"
+
+        mock_entity = MagicMock()
+        mock_entity.entity_type = EntityTypes.IR_EMITTER
+        driver.api.configured_entities.get = MagicMock(return_value=mock_entity)
+
+        await driver.refresh_entity_state("media_player.dev1")
+
+        driver.api.configured_entities.update_attributes.assert_called_once_with(
+            "media_player.dev1",
+            {remote.Attributes.STATE: button.States.AVAILABLE},
+        )
+
+    @pytest.mark.asyncio
+    async def test_refresh_entity_state_unsupported_type(self):
+        """Test refresh_entity_state skips entity types without a STATE attribute."""
+        driver = self._create_driver()
+        config = DeviceConfigForTests("dev1", "Device 1", "192.168.1.1")
+        driver.add_configured_device(config, connect=False)
+
+        mock_entity = MagicMock()
+        mock_entity.entity_type = EntityTypes.SELECT
+        driver.api.configured_entities.get = MagicMock(return_value=mock_entity)
+
+        await driver.refresh_entity_state("media_player.dev1")
+
+        driver.api.configured_entities.update_attributes.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_refresh_entity_state_disconnected(self):
         """Test refresh_entity_state when device is disconnected."""
@@ -1973,12 +2543,17 @@ class TestOnSubscribeEntitiesEdgeCases:
         assert len(driver._configured_devices) == 0
 
     @pytest.mark.asyncio
-    async def test_on_subscribe_entities_invalid_entity_id(self):
-        """Test on_subscribe_entities with invalid entity ID format raises ValueError."""
+    async def test_on_subscribe_entities_invalid_entity_id(self, caplog):
+        """Test on_subscribe_entities logs and skips an invalid entity ID format."""
         driver = self._create_driver()
-        # Entity ID without dots can't be parsed and should raise ValueError
-        with pytest.raises(ValueError, match="does not contain the expected separator"):
-            await driver.on_subscribe_entities(["invalid_entity_id"])
+        driver.refresh_entity_state = AsyncMock()
+
+        # Entity ID without dots can't be parsed and is skipped
+        await driver.on_subscribe_entities(["invalid_entity_id"])
+
+        assert "Skipping subscription of entity invalid_entity_id" in caplog.text
+        driver.refresh_entity_state.assert_not_called()
+        assert len(driver._configured_devices) == 0
 
     @pytest.mark.asyncio
     async def test_on_subscribe_entities_no_device_config(self):
@@ -1997,6 +2572,43 @@ class TestOnSubscribeEntitiesEdgeCases:
         # Should not add any device
         assert "dev1" not in driver._configured_devices
 
+    @pytest.mark.asyncio
+    async def test_on_subscribe_entities_refresh_failure_isolated(self):
+        """Test a failing entity refresh does not prevent the others from refreshing."""
+        driver = self._create_driver()
+        config = DeviceConfigForTests("dev1", "Device 1", "192.168.1.1")
+        driver.add_configured_device(config, connect=False)
+
+        refreshed = []
+
+        async def refresh(entity_id):
+            if entity_id == "media_player.dev1.bad":
+                raise RuntimeError("boom")
+            refreshed.append(entity_id)
+
+        driver.refresh_entity_state = refresh
+
+        await driver.on_subscribe_entities(
+            ["media_player.dev1", "media_player.dev1.bad", "light.dev1"]
+        )
+
+        assert refreshed == ["media_player.dev1", "light.dev1"]
+
+    @pytest.mark.asyncio
+    async def test_on_subscribe_entities_parses_each_entity_id_once(self):
+        """Test on_subscribe_entities parses each entity id only once."""
+        driver = self._create_driver()
+        config = DeviceConfigForTests("dev1", "Device 1", "192.168.1.1")
+        driver.add_configured_device(config, connect=False)
+        driver.refresh_entity_state = AsyncMock()
+
+        with patch.object(
+            driver, "device_from_entity_id", wraps=driver.device_from_entity_id
+        ) as mock_parse:
+            await driver.on_subscribe_entities(["media_player.dev1", "light.dev1"])
+
+        assert mock_parse.call_count == 2
+
 
 class TestDeviceEventHandlersEntityTypes:
     """Tests for device event handlers with different entity types."""
@@ -2097,6 +2709,62 @@ class TestDeviceEventHandlersEntityTypes:
 
             driver.api.configured_entities.update_attributes.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_on_device_disconnected_state_attribute_per_type(self):
+        """Test on_device_disconnected writes each type's own STATE attribute."""
+        driver = self._create_driver()
+        config = DeviceConfigForTests("dev1", "Device 1", "192.168.1.1")
+        driver.add_configured_device(config, connect=False)
+
+        for entity_type, state_attr in [
+            (EntityTypes.MEDIA_PLAYER, media_player.Attributes.STATE),
+            (EntityTypes.IR_EMITTER, remote.Attributes.STATE),
+        ]:
+            mock_entity = MagicMock()
+            mock_entity.entity_type = entity_type
+            driver.api.configured_entities.get = MagicMock(return_value=mock_entity)
+            driver.api.configured_entities.update_attributes = MagicMock()
+
+            await driver.on_device_disconnected("dev1")
+
+            driver.api.configured_entities.update_attributes.assert_called_once_with(
+                "media_player.dev1", {state_attr: media_player.States.UNAVAILABLE}
+            )
+
+    @pytest.mark.asyncio
+    async def test_on_device_connection_error_skips_unchanged_state(self):
+        """Test repeated errors do not re-emit an UNAVAILABLE state."""
+        driver = self._create_driver()
+        config = DeviceConfigForTests("dev1", "Device 1", "192.168.1.1")
+        driver.add_configured_device(config, connect=False)
+
+        mock_entity = MagicMock()
+        mock_entity.entity_type = EntityTypes.MEDIA_PLAYER
+        mock_entity.attributes = {
+            media_player.Attributes.STATE: media_player.States.UNAVAILABLE
+        }
+        driver.api.configured_entities.get = MagicMock(return_value=mock_entity)
+        driver.api.configured_entities.update_attributes = MagicMock()
+
+        await driver.on_device_connection_error("dev1", "timeout")
+
+        driver.api.configured_entities.update_attributes.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_on_device_connected_skips_types_without_state(self):
+        """Test on_device_connected ignores entity types without a STATE attribute."""
+        driver = self._create_driver()
+        config = DeviceConfigForTests("dev1", "Device 1", "192.168.1.1")
+        driver.add_configured_device(config, connect=False)
+
+        mock_entity = MagicMock()
+        mock_entity.entity_type = EntityTypes.SELECT
+        driver.api.configured_entities.get = MagicMock(return_value=mock_entity)
+
+        await driver.on_device_connected("dev1")
+
+        driver.api.configured_entities.update_attributes.assert_not_called()
+
 
 class TestOnDeviceUpdateEntityTypes:
     """Tests for on_device_update with various entity types."""
@@ -2380,6 +3048,150 @@ class TestDriverCoverageGaps:
         assert media_player.Attributes.MEDIA_POSITION in attributes
         assert media_player.Attributes.MEDIA_TITLE in attributes
 
+    @pytest.mark.asyncio
+    async def test_on_device_update_media_player_off_drops_other_attributes(self):
+        """Test the OFF update only carries STATE and the cleared media attributes."""
+        driver = self._create_driver()
+        config = DeviceConfigForTests("dev1", "Device 1", "192.168.1.1")
+        driver.add_configured_device(config, connect=False)
+
+        mock_entity = MagicMock()
+        mock_entity.entity_type = EntityTypes.MEDIA_PLAYER
+        driver.api.configured_entities.get = MagicMock(return_value=mock_entity)
+        driver.api.configured_entities.contains = MagicMock(return_value=True)
+        driver.api.configured_entities.update_attributes = MagicMock()
+
+        await driver.on_device_update(
+            "dev1", {"state": "OFF", "volume": 30, "media_title": "Song"}
+        )
+
+        attributes = driver.api.configured_entities.update_attributes.call_args[0][1]
+        assert attributes[media_player.Attributes.STATE] == media_player.States.OFF
+        assert attributes[media_player.Attributes.MEDIA_TITLE] == ""
+        assert media_player.Attributes.VOLUME not in attributes
+
+    @pytest.mark.asyncio
+    async def test_on_device_update_passes_through_none_values(self):
+        """Test attributes explicitly set to None in the update are forwarded."""
+        driver = self._create_driver()
+        config = DeviceConfigForTests("dev1", "Device 1", "192.168.1.1")
+        driver.add_configured_device(config, connect=False)
+
+        mock_entity = MagicMock()
+        mock_entity.entity_type = EntityTypes.SENSOR
+        driver.api.configured_entities.get = MagicMock(return_value=mock_entity)
+        driver.api.configured_entities.contains = MagicMock(return_value=True)
+        driver.api.configured_entities.update_attributes = MagicMock()
+
+        await driver.on_device_update("dev1", {"value": 21.5, "unit": None})
+
+        driver.api.configured_entities.update_attributes.assert_called_once_with(
+            "dev1", {sensor.Attributes.VALUE: 21.5, sensor.Attributes.UNIT: None}
+        )
+
+    @pytest.mark.asyncio
+    async def test_on_device_update_ignores_unrecognized_keys(self):
+        """Test an update with no keys known to the entity type is dropped early."""
+        driver = self._create_driver()
+        config = DeviceConfigForTests("dev1", "Device 1", "192.168.1.1")
+        driver.add_configured_device(config, connect=False)
+
+        mock_entity = MagicMock()
+        mock_entity.entity_type = EntityTypes.MEDIA_PLAYER
+        driver.api.configured_entities.get = MagicMock(return_value=mock_entity)
+        driver.api.configured_entities.contains = MagicMock(return_value=True)
+        driver.api.configured_entities.update_attributes = MagicMock()
+
+        await driver.on_device_update("dev1", {"rssi": -60, "uptime": 1234})
+
+        driver.api.configured_entities.contains.assert_not_called()
+        driver.api.configured_entities.update_attributes.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_on_device_update_coalesces_bursts(self):
+        """Test bursty updates are merged into one call when coalescing is enabled."""
+        driver = self._create_driver()
+        driver.update_coalesce_delay = 0.01
+
+        mock_entity = MagicMock()
+        mock_entity.entity_type = EntityTypes.MEDIA_PLAYER
+        driver.api.configured_entities.get = MagicMock(return_value=mock_entity)
+        driver.api.configured_entities.update_attributes = MagicMock()
+
+        await driver.on_device_update("mp1", {"volume": 10, "media_title": "A"})
+        await driver.on_device_update("mp1", {"volume": 20, "muted": True})
+
+        driver.api.configured_entities.update_attributes.assert_not_called()
+        await asyncio.sleep(0.05)
+
+        driver.api.configured_entities.update_attributes.assert_called_once_with(
+            "mp1",
+            {
+                media_player.Attributes.VOLUME: 20,
+                media_player.Attributes.MEDIA_TITLE: "A",
+                media_player.Attributes.MUTED: True,
+            },
+        )
+
+    @pytest.mark.asyncio
+    async def test_flush_pending_updates(self):
+        """Test pending coalesced updates can be flushed immediately."""
+        driver = self._create_driver()
+        driver.update_coalesce_delay = 10
+
+        mock_entity = MagicMock()
+        mock_entity.entity_type = EntityTypes.SWITCH
+        driver.api.configured_entities.get = MagicMock(return_value=mock_entity)
+        driver.api.configured_entities.update_attributes = MagicMock()
+
+        await driver.on_device_update("switch1", {"state": "ON"})
+        driver.flush_pending_updates()
+
+        driver.api.configured_entities.update_attributes.assert_called_once()
+        assert driver._pending_updates == {}
+        assert driver._flush_handle is None
+
+    @pytest.mark.asyncio
+    async def test_device_unavailable_drops_pending_updates(self):
+        """Test a pending coalesced update cannot overwrite UNAVAILABLE later."""
+        driver = self._create_driver()
+        driver.update_coalesce_delay = 10
+        config = DeviceConfigForTests("dev1", "Device 1", "192.168.1.1")
+        driver.add_configured_device(config, connect=False)
+
+        mock_entity = MagicMock()
+        mock_entity.entity_type = EntityTypes.MEDIA_PLAYER
+        mock_entity.attributes = {}
+        driver.api.configured_entities.get = MagicMock(return_value=mock_entity)
+        driver.api.configured_entities.update_attributes = MagicMock()
+
+        await driver.on_device_update("media_player.dev1", {"state": "ON"})
+        await driver.on_device_disconnected("dev1")
+        driver.flush_pending_updates()
+
+        driver.api.configured_entities.update_attributes.assert_called_once_with(
+            "media_player.dev1",
+            {media_player.Attributes.STATE: media_player.States.UNAVAILABLE},
+        )
+
+    @pytest.mark.asyncio
+    async def test_remove_device_drops_pending_updates(self):
+        """Test removing a device discards its pending coalesced updates."""
+        driver = self._create_driver()
+        driver.update_coalesce_delay = 10
+        config = DeviceConfigForTests("dev1", "Device 1", "192.168.1.1")
+        driver.add_configured_device(config, connect=False)
+
+        mock_entity = MagicMock()
+        mock_entity.entity_type = EntityTypes.MEDIA_PLAYER
+        driver.api.configured_entities.get = MagicMock(return_value=mock_entity)
+        driver.api.configured_entities.update_attributes = MagicMock()
+
+        await driver.on_device_update("media_player.dev1", {"volume": 10})
+        driver.remove_device("dev1")
+
+        assert driver._pending_updates == {}
+
     @pytest.mark.asyncio
     async def test_on_device_update_entity_not_found(self, caplog):
         """Test on_device_update when entity is not found in configured or available."""
@@ -2729,6 +3541,42 @@ class TestDynamicEntityRegistration:
         # Verify entity was replaced (both calls should succeed without error)
         assert driver.api.available_entities.contains("media_player.test")
 
+    def test_add_entity_same_instance_not_readded(self, driver):
+        """Test that re-adding the already registered instance leaves it in place."""
+        entity = media_player.MediaPlayer(
+            "media_player.test",
+            "Test",
+            [media_player.Features.ON_OFF],
+            {media_player.Attributes.STATE: media_player.States.OFF},
+        )
+        driver.add_entity(entity)
+        driver.api.available_entities.remove = MagicMock()
+        driver.api.available_entities.add = MagicMock()
+
+        driver.add_entity(entity)
+
+        driver.api.available_entities.remove.assert_not_called()
+        driver.api.available_entities.add.assert_not_called()
+
+    def test_register_available_entities_skips_unchanged_instances(self, driver):
+        """Test re-registering the same entity instances does not churn available entities."""
+        entity = media_player.MediaPlayer(
+            "media_player.dev1",
+            "Device 1",
+            [media_player.Features.ON_OFF],
+            {media_player.Attributes.STATE: media_player.States.OFF},
+        )
+        driver.create_entities = MagicMock(return_value=[entity])
+        config = DeviceConfigForTests("dev1", "Device 1", "192.168.1.1")
+        driver.add_configured_device(config, connect=False)
+        driver.api.available_entities.remove = MagicMock()
+        driver.api.available_entities.add = MagicMock()
+
+        driver.register_available_entities(config, driver._configured_devices["dev1"])
+
+        driver.api.available_entities.remove.assert_not_called()
+        driver.api.available_entities.add.assert_not_called()
+
     def test_device_can_add_entity_via_driver_reference(self, driver):
         """Test that a device can add entities dynamically using its driver reference."""
         config = DeviceConfigForTests("hub1", "Hub 1", "192.168.1.1")
@@ -5,6 +5,7 @@ from unittest.mock import MagicMock
 import pytest
 from ucapi import media_player, sensor
 
+from ucapi_framework import entity as entity_module
 from ucapi_framework.entity import Entity
 
 
@@ -105,6 +106,25 @@ class TestEntityABC:
         # Test None handling
         assert entity.map_entity_states(None) == media_player.States.UNKNOWN
 
+    def test_map_entity_states_non_string_and_cached(self, mock_api):
+        """Test non-string states map by their str() and repeats hit the cache."""
+
+        class DeviceState:
+            def __str__(self):
+                return "standby"
+
+        entity = TestMediaPlayer("media_player.test", "Test Player")
+        entity._api = mock_api  # noqa: SLF001
+
+        assert entity.map_entity_states(DeviceState()) == media_player.States.STANDBY
+
+        entity_module._map_state_str.cache_clear()  # noqa: SLF001
+        entity.map_entity_states("Playing")
+        entity.map_entity_states("Playing")
+        info = entity_module._map_state_str.cache_info()  # noqa: SLF001
+        assert info.hits == 1
+        assert info.misses == 1
+
     def test_map_entity_states_custom_override(self, mock_api):
         """Test custom state mapping override."""
         entity = CustomStateMediaPlayer("media_player.custom", "Custom Player")
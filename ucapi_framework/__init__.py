@@ -39,6 +39,7 @@ from .discovery import (
     NetworkScanDiscovery,
     SDDPDiscovery,
     SSDPDiscovery,
+    SSDPHeaders,
 )
 from .migration import (
     EntityMigrationMapping,
@@ -81,6 +82,7 @@ __all__ = [
     "NetworkScanDiscovery",
     "SDDPDiscovery",
     "SSDPDiscovery",
+    "SSDPHeaders",
     "EntityMigrationMapping",
     "MigrationData",
     "migrate_entities_on_remote",
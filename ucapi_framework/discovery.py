@@ -34,15 +34,139 @@ for integrations that don't use them. Install only what you need:
 :license: Mozilla Public License Version 2.0, see LICENSE for more details.
 """
 
+import asyncio
+import functools
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Mapping
 from dataclasses import dataclass
-from typing import Any, Callable
+from typing import Any, Callable, TypedDict, cast
+
+import aiohttp
 
 _LOG = logging.getLogger(__name__)
 
 
-@dataclass
+@functools.cache
+def _load_ssdpy() -> Any:
+    """
+    Import the ssdpy client class.
+
+    The result is cached after the first successful import so repeated
+    discovery runs skip the import machinery entirely.
+
+    :return: The ``ssdpy.SSDPClient`` class
+    :raises ImportError: If ssdpy is not installed
+    """
+    try:
+        from ssdpy import SSDPClient  # type: ignore[import-not-found]
+    except ImportError as err:
+        raise ImportError(
+            "ssdpy package is required for SSDP discovery. "
+            "Install it with: pip install ssdpy"
+        ) from err
+    return SSDPClient
+
+
+@functools.cache
+def _load_sddp() -> tuple[Any, str, int]:
+    """
+    Import the sddp-discovery-protocol module and its default constants.
+
+    :return: Tuple of (sddp module, default multicast address, default port)
+    :raises ImportError: If sddp-discovery-protocol is not installed
+    """
+    try:
+        import sddp_discovery_protocol as sddp  # type: ignore[import-not-found]
+        from sddp_discovery_protocol.constants import (  # type: ignore[import-not-found]
+            SDDP_MULTICAST_ADDRESS,
+            SDDP_PORT,
+        )
+    except ImportError as err:
+        raise ImportError(
+            "sddp-discovery-protocol package is required for SDDP discovery. "
+            "Install it with: pip install sddp-discovery-protocol"
+        ) from err
+    return sddp, SDDP_MULTICAST_ADDRESS, SDDP_PORT
+
+
+@functools.cache
+def _load_zeroconf() -> tuple[Any, Any, Any]:
+    """
+    Import the zeroconf classes used for mDNS discovery.
+
+    :return: Tuple of (ServiceBrowser, ServiceListener, Zeroconf) classes
+    :raises ImportError: If zeroconf is not installed
+    """
+    try:
+        from zeroconf import ServiceBrowser, ServiceListener, Zeroconf  # type: ignore[import-not-found]
+    except ImportError as err:
+        raise ImportError(
+            "zeroconf package is required for mDNS discovery. "
+            "Install it with: pip install zeroconf"
+        ) from err
+    return ServiceBrowser, ServiceListener, Zeroconf
+
+
+class SSDPHeaders(TypedDict, total=False):
+    """Headers of an SSDP response as passed to SSDPDiscovery.parse_ssdp_device().
+
+    Header names are lowercase. Devices may omit any header, and other
+    headers sent by the device are passed through as well.
+    """
+
+    usn: str
+    """Unique Service Name (e.g., 'uuid:...::urn:schemas-upnp-org:device:...')."""
+
+    st: str
+    """Search target the device responded to."""
+
+    location: str
+    """URL of the device description XML."""
+
+    server: str
+    """Server string (OS, UPnP version and product)."""
+
+    nt: str
+    """Notification type (NOTIFY messages)."""
+
+    nts: str
+    """Notification sub type (e.g., 'ssdp:alive')."""
+
+
+def _normalize_ssdp_headers(raw_device: Mapping[str, Any]) -> SSDPHeaders:
+    """
+    Normalize a raw SSDP response into a dict with lowercase header names.
+
+    :param raw_device: Raw SSDP response headers
+    :return: Headers keyed by lowercase header name
+    """
+    return cast(
+        SSDPHeaders,
+        {header.lower(): value for header, value in raw_device.items()},
+    )
+
+
+def _compile_header_filter(
+    spec: Mapping[str, str],
+) -> Callable[[SSDPHeaders], bool]:
+    """
+    Compile a header filter mapping into a predicate on raw SSDP responses.
+
+    :param spec: Header name to substring the header value must contain.
+                 Header names are matched case-insensitively.
+    :return: Predicate returning True if all headers match
+    """
+    criteria = tuple((header.lower(), value) for header, value in spec.items())
+
+    def matches(raw_device: SSDPHeaders) -> bool:
+        headers = cast(Mapping[str, str], raw_device)
+        return all(value in headers.get(header, "") for header, value in criteria)
+
+    return matches
+
+
+@dataclass(slots=True)
 class DiscoveredDevice:
     """
     Common structure for discovered devices.
@@ -86,6 +210,8 @@ class BaseDiscovery(ABC):
         """
         self.timeout = timeout
         self._discovered_devices: list[DiscoveredDevice] = []
+        self._http_session: aiohttp.ClientSession | None = None
+        self._descriptor_cache: dict[str, tuple[str, bytes]] = {}
 
     @property
     def devices(self) -> list[DiscoveredDevice]:
@@ -108,10 +234,66 @@ class BaseDiscovery(ABC):
         :return: List of discovered devices
         """
 
+    async def discover_stream(self) -> AsyncIterator[DiscoveredDevice]:
+        """
+        Perform device discovery, yielding devices as soon as they are found.
+
+        Lets callers show results live or stop early once the wanted device
+        appears instead of waiting for the full timeout. The default
+        implementation runs discover() and yields its results, so custom
+        discovery classes that only implement discover() work unchanged.
+
+        :return: Async iterator of discovered devices
+        """
+        for device in list(await self.discover()):
+            yield device
+
     def clear(self) -> None:
         """Clear the list of discovered devices."""
         self._discovered_devices.clear()
 
+    async def close(self) -> None:
+        """Close the HTTP session used for descriptor fetches."""
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
+
+    async def _fetch_descriptor(self, url: str) -> bytes:
+        """
+        Fetch a device descriptor (e.g., UPnP description XML) over HTTP.
+
+        Uses one session per discovery instance so devices on the same host reuse
+        keep-alive connections. Responses with an ETag are cached and revalidated
+        with If-None-Match, so repeated discovery runs skip unchanged bodies.
+
+        SSDPDiscovery closes the session when a discovery run finishes. Other
+        callers must call close() once they are done fetching.
+
+        :param url: Descriptor URL
+        :return: Response body
+        :raises aiohttp.ClientError: If the request fails
+        """
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=4, ttl_dns_cache=60),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+
+        headers = {}
+        cached = self._descriptor_cache.get(url)
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
+
+        async with self._http_session.get(url, headers=headers) as response:
+            if response.status == 304 and cached is not None:
+                return cached[1]
+            response.raise_for_status()
+            body = await response.read()
+            etag = response.headers.get("ETag")
+            if etag:
+                self._descriptor_cache[url] = (etag, body)
+            return body
+
 
 class SSDPDiscovery(BaseDiscovery):
     """
@@ -125,56 +307,93 @@ class SSDPDiscovery(BaseDiscovery):
         self,
         search_target: str = "ssdp:all",
         timeout: int = 5,
-        device_filter: Callable | None = None,
+        device_filter: Callable | Mapping[str, str] | None = None,
     ):
         """
         Initialize SSDP discovery.
 
         :param search_target: SSDP search target (e.g., "ssdp:all", "urn:schemas-upnp-org:device:MediaRenderer:1")
         :param timeout: Discovery timeout in seconds
-        :param device_filter: Optional filter function to filter discovered devices
+        :param device_filter: Optional filter for raw SSDP responses. Either a function
+                              returning True for devices to keep, or a mapping of header
+                              name to a substring the header must contain
+                              (e.g., {"server": "Sonos"})
         """
         super().__init__(timeout)
         self.search_target = search_target
         self.device_filter = device_filter
 
+    @property
+    def device_filter(self) -> Callable | Mapping[str, str] | None:
+        """
+        Get the device filter applied to raw SSDP responses.
+
+        :return: Filter function, header mapping, or None
+        """
+        return self._device_filter_spec
+
+    @device_filter.setter
+    def device_filter(self, value: Callable | Mapping[str, str] | None) -> None:
+        """
+        Set the device filter, compiling header mappings into a predicate.
+
+        :param value: Filter function, header mapping, or None
+        """
+        self._device_filter_spec = value
+        if isinstance(value, Mapping):
+            self._device_filter = _compile_header_filter(value)
+        else:
+            self._device_filter = value
+
     async def discover(self) -> list[DiscoveredDevice]:
         """
         Perform SSDP discovery.
 
         :return: List of discovered devices
         """
+        async for _ in self.discover_stream():
+            pass
+        return self._discovered_devices
+
+    async def discover_stream(self) -> AsyncIterator[DiscoveredDevice]:
+        """
+        Perform SSDP discovery, yielding each device as it is parsed.
+
+        :return: Async iterator of discovered devices
+        """
         _LOG.info(
             "Starting SSDP discovery (target: %s, timeout: %ds)",
             self.search_target,
             self.timeout,
         )
 
-        try:
-            try:
-                from ssdpy import SSDPClient  # type: ignore[import-not-found]
-            except ImportError as err:
-                raise ImportError(
-                    "ssdpy package is required for SSDP discovery. "
-                    "Install it with: pip install ssdpy"
-                ) from err
+        self._discovered_devices.clear()
 
-            client = SSDPClient(timeout=self.timeout)
-            raw_devices = client.m_search(self.search_target)
+        try:
+            ssdp_client_cls = _load_ssdpy()
+            client = ssdp_client_cls(timeout=self.timeout)
+            # ssdpy blocks for the whole timeout, keep it off the event loop
+            raw_devices = await asyncio.get_running_loop().run_in_executor(
+                None, client.m_search, self.search_target
+            )
 
             _LOG.debug("Found %d SSDP devices", len(raw_devices))
 
-            self._discovered_devices.clear()
+            device_filter = self._device_filter
+            debug = _LOG.isEnabledFor(logging.DEBUG)
+            for raw_device in map(_normalize_ssdp_headers, raw_devices):
+                if debug:
+                    _LOG.debug("Parsing SSDP response from %s", raw_device.get("usn"))
 
-            for raw_device in raw_devices:
                 # Apply filter if provided
-                if self.device_filter and not self.device_filter(raw_device):
+                if device_filter and not device_filter(raw_device):
                     continue
 
                 # Parse device info
-                device = self.parse_ssdp_device(raw_device)
+                device = await self.async_parse_ssdp_device(raw_device)
                 if device:
                     self._discovered_devices.append(device)
+                    yield device
 
             _LOG.info(
                 "SSDP discovery complete: found %d device(s)",
@@ -183,15 +402,39 @@ class SSDPDiscovery(BaseDiscovery):
 
         except Exception as err:  # pylint: disable=broad-exception-caught
             _LOG.error("SSDP discovery error: %s", err)
+        finally:
+            # Release the descriptor session; the ETag cache survives for the next run
+            await self.close()
 
-        return self._discovered_devices
+    async def async_parse_ssdp_device(
+        self, raw_device: SSDPHeaders
+    ) -> DiscoveredDevice | None:
+        """
+        Parse raw SSDP device data into DiscoveredDevice (async version).
+
+        Default implementation: calls parse_ssdp_device(). Override this method
+        if parsing needs I/O, e.g. fetching the description XML behind the
+        location header with _fetch_descriptor().
+
+        :param raw_device: Raw SSDP device data
+        :return: DiscoveredDevice or None if parsing fails
+        """
+        return self.parse_ssdp_device(raw_device)
 
     @abstractmethod
-    def parse_ssdp_device(self, raw_device: dict) -> DiscoveredDevice | None:
+    def parse_ssdp_device(self, raw_device: SSDPHeaders) -> DiscoveredDevice | None:
         """
         Parse raw SSDP device data into DiscoveredDevice.
 
         Override this method to extract device information from SSDP response.
+        Header names are normalized to lowercase (e.g., "location", "usn", "server").
+        For parsing that needs I/O, override async_parse_ssdp_device() instead.
+
+        This runs once per response, which can be hundreds for "ssdp:all". Guard
+        debug logging of whole responses so it costs nothing when disabled:
+
+            if _LOG.isEnabledFor(logging.DEBUG):
+                _LOG.debug("Raw SSDP response: %s", raw_device)
 
         :param raw_device: Raw SSDP device data
         :return: DiscoveredDevice or None if parsing fails
@@ -238,30 +481,30 @@ class SDDPDiscovery(BaseDiscovery):
 
         :return: List of discovered devices
         """
+        async for _ in self.discover_stream():
+            pass
+        return self._discovered_devices
+
+    async def discover_stream(self) -> AsyncIterator[DiscoveredDevice]:
+        """
+        Perform SDDP discovery, yielding each device as its response arrives.
+
+        :return: Async iterator of discovered devices
+        """
         _LOG.info(
             "Starting SDDP discovery (pattern: %s, timeout: %ds)",
             self.search_pattern,
             self.timeout,
         )
 
+        self._discovered_devices.clear()
+
         try:
-            try:
-                import sddp_discovery_protocol as sddp  # type: ignore[import-not-found]
-                from sddp_discovery_protocol.constants import (  # type: ignore[import-not-found]
-                    SDDP_MULTICAST_ADDRESS,
-                    SDDP_PORT,
-                )
-            except ImportError as err:
-                raise ImportError(
-                    "sddp-discovery-protocol package is required for SDDP discovery. "
-                    "Install it with: pip install sddp-discovery-protocol"
-                ) from err
+            sddp, default_address, default_port = _load_sddp()
 
             # Use defaults if not specified
-            multicast_address = self.multicast_address or SDDP_MULTICAST_ADDRESS
-            multicast_port = self.multicast_port or SDDP_PORT
-
-            self._discovered_devices.clear()
+            multicast_address = self.multicast_address or default_address
+            multicast_port = self.multicast_port or default_port
 
             async with sddp.SddpClient(
                 search_pattern=self.search_pattern,
@@ -281,6 +524,7 @@ class SDDPDiscovery(BaseDiscovery):
                         )
                         if device:
                             self._discovered_devices.append(device)
+                            yield device
 
             _LOG.info(
                 "SDDP discovery complete: found %d device(s)",
@@ -290,8 +534,6 @@ class SDDPDiscovery(BaseDiscovery):
         except Exception as err:  # pylint: disable=broad-exception-caught
             _LOG.error("SDDP discovery error: %s", err)
 
-        return self._discovered_devices
-
     @abstractmethod
     def parse_sddp_response(
         self, datagram: Any, response_info: Any
@@ -332,15 +574,20 @@ class MDNSDiscovery(BaseDiscovery):
         self,
         service_type: str,
         timeout: int = 5,
+        quiet_period: float | None = None,
     ):
         """
         Initialize mDNS discovery.
 
         :param service_type: mDNS service type (e.g., "_airplay._tcp.local.", "_googlecast._tcp.local.")
-        :param timeout: Discovery timeout in seconds
+        :param timeout: Discovery timeout in seconds (upper bound)
+        :param quiet_period: Optional number of seconds without new services after which
+                             discovery ends early, once at least one device was found.
+                             None (default) always waits for the full timeout.
         """
         super().__init__(timeout)
         self.service_type = service_type
+        self.quiet_period = quiet_period
 
     async def discover(self) -> list[DiscoveredDevice]:
         """
@@ -348,31 +595,36 @@ class MDNSDiscovery(BaseDiscovery):
 
         :return: List of discovered devices
         """
+        async for _ in self.discover_stream():
+            pass
+        return self._discovered_devices
+
+    async def discover_stream(self) -> AsyncIterator[DiscoveredDevice]:
+        """
+        Perform mDNS discovery, yielding each service as it is resolved.
+
+        :return: Async iterator of discovered devices
+        """
         _LOG.info(
             "Starting mDNS discovery (service: %s, timeout: %ds)",
             self.service_type,
             self.timeout,
         )
 
+        self._discovered_devices.clear()
+
         try:
-            try:
-                from zeroconf import ServiceBrowser, ServiceListener, Zeroconf  # type: ignore[import-not-found]
-            except ImportError as err:
-                raise ImportError(
-                    "zeroconf package is required for mDNS discovery. "
-                    "Install it with: pip install zeroconf"
-                ) from err
+            ServiceBrowser, ServiceListener, Zeroconf = _load_zeroconf()
 
-            import asyncio
-
-            zeroconf = Zeroconf()
-            discovered = []
+            loop = asyncio.get_running_loop()
+            # Fed from zeroconf's browser thread
+            found: asyncio.Queue[Any] = asyncio.Queue()
 
             class Listener(ServiceListener):
                 def add_service(self, zc: Zeroconf, type_: str, name: str) -> None:
                     info = zc.get_service_info(type_, name)
                     if info:
-                        discovered.append(info)
+                        loop.call_soon_threadsafe(found.put_nowait, info)
 
                 def remove_service(self, zc: Zeroconf, type_: str, name: str) -> None:
                     pass
@@ -380,20 +632,31 @@ class MDNSDiscovery(BaseDiscovery):
                 def update_service(self, zc: Zeroconf, type_: str, name: str) -> None:
                     pass
 
+            # Created per run so the instance never outlives the event loop it
+            # was started from
+            zeroconf = Zeroconf()
             browser = ServiceBrowser(zeroconf, self.service_type, Listener())
 
-            # Wait for discovery timeout
-            await asyncio.sleep(self.timeout)
-
-            browser.cancel()
-            zeroconf.close()
-
-            self._discovered_devices.clear()
-
-            for service_info in discovered:
-                device = self.parse_mdns_service(service_info)
-                if device:
-                    self._discovered_devices.append(device)
+            try:
+                # Yield services until the discovery timeout expires, or until no new
+                # service arrived within the quiet period once something was found
+                deadline = loop.time() + self.timeout
+                while (remaining := deadline - loop.time()) > 0:
+                    if self.quiet_period is not None and self._discovered_devices:
+                        remaining = min(remaining, self.quiet_period)
+                    try:
+                        service_info = await asyncio.wait_for(found.get(), remaining)
+                    except TimeoutError:
+                        break
+
+                    device = self.parse_mdns_service(service_info)
+                    if device:
+                        self._discovered_devices.append(device)
+                        yield device
+            finally:
+                # Also runs on cancellation or early close of the stream
+                browser.cancel()
+                zeroconf.close()
 
             _LOG.info(
                 "mDNS discovery complete: found %d device(s)",
@@ -403,8 +666,6 @@ class MDNSDiscovery(BaseDiscovery):
         except Exception as err:  # pylint: disable=broad-exception-caught
             _LOG.error("mDNS discovery error: %s", err)
 
-        return self._discovered_devices
-
     @abstractmethod
     def parse_mdns_service(self, service_info: Any) -> DiscoveredDevice | None:
         """
@@ -9,9 +9,13 @@ Provides common event handlers and device lifecycle management.
 
 import asyncio
 import logging
-from collections.abc import Callable
+import random
+from collections.abc import Awaitable, Callable, Coroutine, Mapping
 from dataclasses import is_dataclass
+from functools import partial
+from itertools import chain
 from enum import Enum
+from types import MappingProxyType
 from typing import Any, Generic, TypeVar, cast
 
 import ucapi
@@ -51,6 +55,122 @@ _DEVICE_ADDRESS_ATTRIBUTES = (
     "host",
 )
 
+# Backoff between connection attempts in _ensure_device_connected (seconds)
+_CONNECT_RETRY_BASE_DELAY = 0.25
+_CONNECT_RETRY_JITTER = 0.1
+_CONNECT_RETRY_DISCONNECT_TIMEOUT = 1.0
+
+# Remote Two events and the driver methods handling them
+_R2_EVENT_HANDLERS: tuple[tuple[ucapi.Events, str], ...] = (
+    (ucapi.Events.CONNECT, "on_r2_connect_cmd"),
+    (ucapi.Events.DISCONNECT, "on_r2_disconnect_cmd"),
+    (ucapi.Events.ENTER_STANDBY, "on_r2_enter_standby"),
+    (ucapi.Events.EXIT_STANDBY, "on_r2_exit_standby"),
+    (ucapi.Events.SUBSCRIBE_ENTITIES, "on_subscribe_entities"),
+    (ucapi.Events.UNSUBSCRIBE_ENTITIES, "on_unsubscribe_entities"),
+)
+
+# Maximum number of devices connecting at the same time on connect/exit standby
+_MAX_CONCURRENT_CONNECTS = 8
+
+# Plain string value of each entity type, used when building entity IDs
+_ENTITY_TYPE_STR: dict[EntityTypes | str, str] = {
+    entity_type: entity_type.value for entity_type in EntityTypes
+}
+
+# STATE attribute for each supported entity type
+_STATE_ATTR_BY_TYPE: dict[EntityTypes, Enum] = {
+    EntityTypes.BUTTON: button.Attributes.STATE,
+    EntityTypes.CLIMATE: climate.Attributes.STATE,
+    EntityTypes.COVER: cover.Attributes.STATE,
+    EntityTypes.LIGHT: light.Attributes.STATE,
+    EntityTypes.MEDIA_PLAYER: media_player.Attributes.STATE,
+    EntityTypes.REMOTE: remote.Attributes.STATE,
+    EntityTypes.SENSOR: sensor.Attributes.STATE,
+    EntityTypes.SWITCH: switch.Attributes.STATE,
+    # Remote shares the same states as IR Emitter
+    EntityTypes.IR_EMITTER: remote.Attributes.STATE,
+    EntityTypes.VOICE_ASSISTANT: voice_assistant.Attributes.STATE,
+}
+
+# Attributes extracted from device updates per entity type.
+# The flag marks STATE attributes whose value goes through state mapping.
+_UPDATE_ATTRS_BY_TYPE: dict[EntityTypes, tuple[tuple[Enum, bool], ...]] = {
+    EntityTypes.BUTTON: ((button.Attributes.STATE, True),),
+    EntityTypes.CLIMATE: (
+        (climate.Attributes.STATE, True),
+        (climate.Attributes.CURRENT_TEMPERATURE, False),
+        (climate.Attributes.TARGET_TEMPERATURE, False),
+        (climate.Attributes.TARGET_TEMPERATURE_HIGH, False),
+        (climate.Attributes.TARGET_TEMPERATURE_LOW, False),
+        (climate.Attributes.FAN_MODE, False),
+    ),
+    EntityTypes.COVER: (
+        (cover.Attributes.STATE, True),
+        (cover.Attributes.POSITION, False),
+        (cover.Attributes.TILT_POSITION, False),
+    ),
+    EntityTypes.LIGHT: (
+        (light.Attributes.STATE, True),
+        (light.Attributes.HUE, False),
+        (light.Attributes.SATURATION, False),
+        (light.Attributes.BRIGHTNESS, False),
+        (light.Attributes.COLOR_TEMPERATURE, False),
+    ),
+    EntityTypes.MEDIA_PLAYER: (
+        (media_player.Attributes.STATE, True),
+        (media_player.Attributes.VOLUME, False),
+        (media_player.Attributes.MUTED, False),
+        (media_player.Attributes.MEDIA_DURATION, False),
+        (media_player.Attributes.MEDIA_POSITION, False),
+        (media_player.Attributes.MEDIA_POSITION_UPDATED_AT, False),
+        (media_player.Attributes.MEDIA_TYPE, False),
+        (media_player.Attributes.MEDIA_IMAGE_URL, False),
+        (media_player.Attributes.MEDIA_TITLE, False),
+        (media_player.Attributes.MEDIA_ARTIST, False),
+        (media_player.Attributes.MEDIA_ALBUM, False),
+        (media_player.Attributes.REPEAT, False),
+        (media_player.Attributes.SHUFFLE, False),
+        (media_player.Attributes.SOURCE, False),
+        (media_player.Attributes.SOURCE_LIST, False),
+        (media_player.Attributes.SOUND_MODE, False),
+        (media_player.Attributes.SOUND_MODE_LIST, False),
+    ),
+    EntityTypes.REMOTE: ((remote.Attributes.STATE, True),),
+    EntityTypes.SENSOR: (
+        (sensor.Attributes.STATE, True),
+        (sensor.Attributes.VALUE, False),
+        (sensor.Attributes.UNIT, False),
+    ),
+    EntityTypes.SWITCH: ((switch.Attributes.STATE, True),),
+    # IR Emitter shares the same state mapping as Remote
+    EntityTypes.IR_EMITTER: ((remote.Attributes.STATE, True),),
+    EntityTypes.VOICE_ASSISTANT: ((voice_assistant.Attributes.STATE, True),),
+}
+
+# Update key -> (attribute, is_state) per entity type, derived from the table above
+# so device updates are resolved by iterating their own (usually few) keys
+_UPDATE_KEY_MAP: dict[EntityTypes, dict[str, tuple[Enum, bool]]] = {
+    entity_type: {attr.value: (attr, is_state) for attr, is_state in attrs}
+    for entity_type, attrs in _UPDATE_ATTRS_BY_TYPE.items()
+}
+
+# Media attributes reset when a media player turns off with clear_media_when_off
+# (empty strings for string fields, 0 for numbers)
+_MEDIA_OFF_CLEAR: Mapping[Enum, Any] = MappingProxyType(
+    {
+        media_player.Attributes.MEDIA_DURATION: 0,
+        media_player.Attributes.MEDIA_POSITION: 0,
+        media_player.Attributes.MEDIA_TYPE: "",
+        media_player.Attributes.MEDIA_IMAGE_URL: "",
+        media_player.Attributes.MEDIA_TITLE: "",
+        media_player.Attributes.MEDIA_ARTIST: "",
+        media_player.Attributes.MEDIA_ALBUM: "",
+        media_player.Attributes.SOURCE: "",
+        media_player.Attributes.SOUND_MODE: "",
+    }
+)
+
 
 class EntitySource(Enum):
     """Source for entity filtering operations."""
@@ -60,7 +180,7 @@ class EntitySource(Enum):
     CONFIGURED = "configured"  # Query only configured entities
 
 
-def _get_first_valid_attr(obj: Any, *attrs: str) -> str | None:
+def _get_first_valid_attr(obj: Any, attrs: tuple[str, ...]) -> str | None:
     """
     Get the first valid attribute value from an object.
 
@@ -72,10 +192,9 @@ def _get_first_valid_attr(obj: Any, *attrs: str) -> str | None:
     :return: String value of first found attribute, or None
     """
     for attr in attrs:
-        if hasattr(obj, attr):
-            value = getattr(obj, attr)
-            if value:
-                return str(value)
+        value = getattr(obj, attr, None)
+        if value:
+            return value if type(value) is str else str(value)
     return None
 
 
@@ -105,9 +224,7 @@ def create_entity_id(
     :param sub_device_id: Optional sub-device identifier (e.g., light ID, zone ID)
     :return: Entity identifier in the format "entity_type.device_id" or "entity_type.device_id.sub_device_id"
     """
-    type_str = (
-        entity_type.value if isinstance(entity_type, EntityTypes) else entity_type
-    )
+    type_str = _ENTITY_TYPE_STR.get(entity_type, entity_type)
 
     if sub_device_id:
         return f"{type_str}.{device_id}.{sub_device_id}"
@@ -127,8 +244,32 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
     Type Parameters:
         DeviceT: The device interface class (e.g., YamahaAVR)
         ConfigT: The device configuration class (e.g., YamahaDevice)
+
+    The driver state is stored in __slots__. Subclass the driver to add your own
+    attributes: a subclass without __slots__ gets a regular __dict__, and a
+    subclass declaring __slots__ can list "__dict__" in them to allow arbitrary
+    attributes.
     """
 
+    # Every attribute assigned on the base class must be listed here
+    __slots__ = (
+        "_loop",
+        "api",
+        "_device_class",
+        "_require_connection_before_registry",
+        "driver_id",
+        "_entity_classes",
+        "_configured_devices",
+        "_connect_semaphore",
+        "_config_manager",
+        "entity_id_separator",
+        "update_coalesce_delay",
+        "_pending_updates",
+        "_flush_handle",
+        "_background_tasks",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         device_class: type[DeviceT],
@@ -167,8 +308,17 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
             self._entity_classes = entity_classes
 
         self._configured_devices: dict[str, DeviceT] = {}
+        self._connect_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_CONNECTS)
         self._config_manager = None  # Set via config_manager property
         self.entity_id_separator = "."  # Default separator for entity IDs
+        # Seconds to merge bursty device updates per entity (0 sends immediately)
+        self.update_coalesce_delay: float = 0.0
+        self._pending_updates: dict[
+            str, tuple[Callable[[dict[str, Any]], Any], dict[str, Any]]
+        ] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # Strong references to fire-and-forget tasks until they complete
+        self._background_tasks: set[asyncio.Task] = set()
         self._setup_event_handlers()
 
     @property
@@ -205,7 +355,8 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
         This method iterates over all devices in the config manager and registers
         them with the driver. When require_connection_before_registry is True,
         it uses async_add_configured_device() which waits for connection before
-        registering entities.
+        registering entities. Those devices are added concurrently (bounded like
+        connect commands), and a failing device does not stop the others.
 
         Call this method during driver initialization after setting the config_manager.
 
@@ -222,22 +373,37 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
             _LOG.warning("Cannot register devices: config_manager is not set")
             return
 
+        if self._require_connection_before_registry:
+            device_configs = list(self._config_manager.all())
+            # Resolved up front so a failing get_device_id() cannot hide the
+            # original error in the failure log below
+            device_labels = []
+            for device_config in device_configs:
+                try:
+                    device_labels.append(self.get_device_id(device_config))
+                except Exception:  # pylint: disable=broad-exception-caught
+                    device_labels.append(repr(device_config))
+
+            results = await asyncio.gather(
+                *(
+                    self.async_add_configured_device(device_config)
+                    for device_config in device_configs
+                ),
+                return_exceptions=True,
+            )
+            for device_label, result in zip(device_labels, results):
+                if isinstance(result, Exception):
+                    _LOG.error("Failed to add device %s: %s", device_label, result)
+            return
+
         for device_config in self._config_manager.all():
-            if self._require_connection_before_registry:
-                await self.async_add_configured_device(device_config)
-            else:
-                self.add_configured_device(device_config, connect=connect)
+            self.add_configured_device(device_config, connect=connect)
 
     def _setup_event_handlers(self) -> None:
         """Register all event handlers with the API."""
-        self.api.listens_to(ucapi.Events.CONNECT)(self.on_r2_connect_cmd)
-        self.api.listens_to(ucapi.Events.DISCONNECT)(self.on_r2_disconnect_cmd)
-        self.api.listens_to(ucapi.Events.ENTER_STANDBY)(self.on_r2_enter_standby)
-        self.api.listens_to(ucapi.Events.EXIT_STANDBY)(self.on_r2_exit_standby)
-        self.api.listens_to(ucapi.Events.SUBSCRIBE_ENTITIES)(self.on_subscribe_entities)
-        self.api.listens_to(ucapi.Events.UNSUBSCRIBE_ENTITIES)(
-            self.on_unsubscribe_entities
-        )
+        add_listener = self.api.add_listener
+        for event, handler_name in _R2_EVENT_HANDLERS:
+            add_listener(event, getattr(self, handler_name))
 
     # ========================================================================
     # Remote Two Event Handlers (can be overridden)
@@ -257,9 +423,7 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
         """
         _LOG.debug("Client connect command: connecting device(s)")
         await self.api.set_device_state(ucapi.DeviceStates.CONNECTED)
-        for device in self._configured_devices.values():
-            # start background task
-            self._loop.create_task(device.connect())
+        self._run_for_devices_in_background(self._gated_connect, "connect")
 
     async def on_r2_disconnect_cmd(self) -> None:
         """
@@ -269,9 +433,9 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
         Override to add custom disconnect logic.
         """
         _LOG.debug("Client disconnect command: disconnecting device(s)")
-        for device in self._configured_devices.values():
-            # start background task
-            self._loop.create_task(device.disconnect())
+        self._run_for_devices_in_background(
+            lambda device: device.disconnect(), "disconnect"
+        )
 
     async def on_r2_enter_standby(self) -> None:
         """
@@ -281,8 +445,16 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
         Override to customize standby behavior.
         """
         _LOG.debug("Enter standby event: disconnecting device(s)")
-        for device in self._configured_devices.values():
-            await device.disconnect()
+        # Separate limit from connects, so standby never waits behind them
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_CONNECTS)
+
+        async def gated_disconnect(device: DeviceT) -> None:
+            async with semaphore:
+                await device.disconnect()
+
+        await self._run_for_devices(
+            list(self._configured_devices.values()), gated_disconnect, "disconnect"
+        )
 
     async def on_r2_exit_standby(self) -> None:
         """
@@ -292,9 +464,80 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
         Override to customize wake behavior.
         """
         _LOG.debug("Exit standby event: connecting device(s)")
-        for device in self._configured_devices.values():
-            # start background task
-            self._loop.create_task(device.connect())
+        self._run_for_devices_in_background(self._gated_connect, "connect")
+
+    def _run_for_devices_in_background(
+        self, action: Callable[[DeviceT], Awaitable[Any]], action_name: str
+    ) -> None:
+        """
+        Run an action for all configured devices in one background task.
+
+        The devices are processed concurrently with a single asyncio.gather, and
+        failures are logged per device instead of being lost in separate tasks.
+
+        :param action: Coroutine function called with each device
+        :param action_name: Action name used in error messages (e.g. "connect")
+        """
+        devices = list(self._configured_devices.values())
+        if devices:
+            self._run_in_background(
+                self._run_for_devices(devices, action, action_name),
+                name=f"devices:{action_name}",
+            )
+
+    async def _run_for_devices(
+        self,
+        devices: list[DeviceT],
+        action: Callable[[DeviceT], Awaitable[Any]],
+        action_name: str,
+    ) -> None:
+        """
+        Run an action for the given devices concurrently and log failures.
+
+        :param devices: Devices to process
+        :param action: Coroutine function called with each device
+        :param action_name: Action name used in error messages (e.g. "connect")
+        """
+        results = await asyncio.gather(
+            *(action(device) for device in devices), return_exceptions=True
+        )
+        for device, result in zip(devices, results):
+            if isinstance(result, Exception):
+                _LOG.error(
+                    "Failed to %s device %s: %s",
+                    action_name,
+                    device.identifier,
+                    result,
+                )
+
+    def _run_in_background(
+        self, coro: Coroutine[Any, Any, Any], name: str | None = None
+    ) -> asyncio.Task:
+        """
+        Schedule a coroutine as a background task.
+
+        The task is referenced by the driver until it completes, so it cannot be
+        garbage collected while running.
+
+        :param coro: Coroutine to run
+        :param name: Optional task name, shown in task dumps and asyncio debug logs
+        :return: The scheduled task
+        """
+        task = self._loop.create_task(coro, name=name)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    async def _gated_connect(self, device: DeviceT) -> None:
+        """
+        Connect a device while limiting the number of concurrent connection attempts.
+
+        Prevents a burst of simultaneous connects when many devices are configured.
+
+        :param device: Device instance
+        """
+        async with self._connect_semaphore:
+            await device.connect()
 
     async def on_subscribe_entities(self, entity_ids: list[str]) -> None:
         """
@@ -321,20 +564,34 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
         if not entity_ids:
             return
 
-        device_id = self.device_from_entity_id(entity_ids[0])
+        # Parse every entity id once and reuse the result for both paths. A
+        # malformed id is skipped so it cannot abort the whole subscription.
+        parsed: list[tuple[str, str | None]] = []
+        for entity_id in entity_ids:
+            try:
+                parsed.append((entity_id, self.device_from_entity_id(entity_id)))
+            except ValueError as err:
+                _LOG.error("Skipping subscription of entity %s: %s", entity_id, err)
+        if not parsed:
+            return
+        valid_ids = [entity_id for entity_id, _ in parsed]
+
+        device_id = parsed[0][1]
         if device_id is None:
-            _LOG.error("Could not extract device_id from entity_id: %s", entity_ids[0])
+            _LOG.error("Could not extract device_id from entity_id: %s", valid_ids[0])
             return
 
         # Path 1: Hub-based integrations that need connection before entity registration
         if self._require_connection_before_registry:
+            device_config = None
             # Check if device is already configured
-            if device_id not in self._configured_devices:
+            device = self._configured_devices.get(device_id)
+            if device is None:
                 # Device not configured - add it and connect
                 device_config = self.get_device_config(device_id)
                 if device_config:
                     # Add device without registering entities yet (connect=False, register=False)
-                    self._add_device_instance(device_config)
+                    device = self._add_device_instance(device_config, device_id)
                 else:
                     _LOG.error(
                         "Failed to subscribe entity: no device config found for %s",
@@ -342,9 +599,8 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
                     )
                     return
 
-            # Get the device and ensure it's connected
-            device = self._configured_devices.get(device_id)
-            if device and not device.is_connected:
+            # Ensure the device is connected
+            if not device.is_connected:
                 # Connect with retries
                 if not await self._ensure_device_connected(device_id):
                     _LOG.error(
@@ -354,14 +610,13 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
                     return
 
                 # After successful connection, register entities from the hub (async)
-                await self.async_register_available_entities(
-                    self.get_device_config(device_id), device
-                )
+                if device_config is None:
+                    device_config = self.get_device_config(device_id)
+                await self.async_register_available_entities(device_config, device)
 
         # Path 2: Standard integrations - add devices for entities that aren't configured yet
         else:
-            for entity_id in entity_ids:
-                eid_device_id = self.device_from_entity_id(entity_id)
+            for entity_id, eid_device_id in parsed:
                 if eid_device_id is None:
                     continue
 
@@ -379,9 +634,15 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
                         entity_id,
                     )
 
-        # Refresh each entity's state
-        for entity_id in entity_ids:
-            await self.refresh_entity_state(entity_id)
+        # Refresh each entity's state concurrently; one failing entity must not
+        # prevent the others from being refreshed
+        results = await asyncio.gather(
+            *(self.refresh_entity_state(entity_id) for entity_id in valid_ids),
+            return_exceptions=True,
+        )
+        for entity_id, result in zip(valid_ids, results):
+            if isinstance(result, Exception):
+                _LOG.error("Failed to refresh state of %s: %s", entity_id, result)
 
     async def on_unsubscribe_entities(self, entity_ids: list[str]) -> None:
         """
@@ -394,20 +655,27 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
         """
         _LOG.debug("Unsubscribe entities event: %s", entity_ids)
 
-        # Track which devices need to be checked
-        devices_to_check = set()
-
+        # Configured devices that need to be checked, de-duplicated in the order
+        # they were first referenced. A malformed id is skipped like on subscribe.
+        configured_devices = self._configured_devices
+        devices_to_check: dict[str, None] = {}
         for entity_id in entity_ids:
-            device_id = self.device_from_entity_id(entity_id)
-            if device_id is not None and device_id in self._configured_devices:
-                devices_to_check.add(device_id)
+            try:
+                device_id = self.device_from_entity_id(entity_id)
+            except ValueError as err:
+                _LOG.error("Skipping unsubscription of entity %s: %s", entity_id, err)
+                continue
+            if device_id is not None and device_id in configured_devices:
+                devices_to_check[device_id] = None
 
-        # For each device, check if any of its entities are still configured
+        # For each device, check if any of its entities are still configured.
+        # configured_entities.get() is a dict lookup, whereas get_all() would build
+        # a dict per entity, so probe the device's own entity ids directly.
+        get_configured = self.api.configured_entities.get
         for device_id in devices_to_check:
             device_entities = self.get_entity_ids_for_device(device_id)
             any_entity_configured = any(
-                self.api.configured_entities.get(entity_id) is not None
-                for entity_id in device_entities
+                get_configured(entity_id) is not None for entity_id in device_entities
             )
 
             if not any_entity_configured:
@@ -454,8 +722,25 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
                 _LOG.info("Device %s connected successfully", device_id)
                 return True
 
-            await device.disconnect()
-            await asyncio.sleep(0.5)
+            # Always clean up: devices with a background connection task (e.g.
+            # WebSocketDevice) report is_connected=False while still retrying.
+            # Bound the cleanup so a slow close does not stall the next attempt.
+            try:
+                await asyncio.wait_for(
+                    device.disconnect(), timeout=_CONNECT_RETRY_DISCONNECT_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                _LOG.debug(
+                    "Device %s did not disconnect within %.1fs, retrying anyway",
+                    device_id,
+                    _CONNECT_RETRY_DISCONNECT_TIMEOUT,
+                )
+            if attempt < 3:
+                # Exponential backoff (0.25s, 0.5s) with jitter between attempts
+                await asyncio.sleep(
+                    _CONNECT_RETRY_BASE_DELAY * 2 ** (attempt - 1)
+                    + random.uniform(0, _CONNECT_RETRY_JITTER)
+                )
 
         _LOG.error("Failed to connect to device %s after 3 attempts", device_id)
         return False
@@ -522,7 +807,8 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
 
         configured_entity = self.api.configured_entities.get(entity_id)
         if configured_entity is None:
-            _LOG.debug("Entity %s is not configured, ignoring", entity_id)
+            if _LOG.isEnabledFor(logging.DEBUG):
+                _LOG.debug("Entity %s is not configured, ignoring", entity_id)
             return
 
         # Check if entity is a framework Entity with update() method
@@ -565,51 +851,22 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
             return
 
         # Path 3: Default fallback - construct minimal STATE attribute
+        entity_type = configured_entity.entity_type
+        state_attr = _STATE_ATTR_BY_TYPE.get(entity_type)
+        if state_attr is None:
+            return
+
         # Default state refresh based on device connection and entity type
         if not device.is_connected or device.state is None:
             state = media_player.States.UNAVAILABLE
-        else:
+        elif entity_type == EntityTypes.MEDIA_PLAYER:
             # For media_player entities, use the device state mapping
-            if configured_entity.entity_type == EntityTypes.MEDIA_PLAYER:
-                state = self.map_device_state(device.state)
-            else:
-                # For other entity types, just mark as available
-                state = button.States.AVAILABLE
-
-        attributes = {}
-
-        # Update the appropriate STATE attribute based on entity type
-        match configured_entity.entity_type:
-            case EntityTypes.BUTTON:
-                attributes[button.Attributes.STATE] = state
-                self.api.configured_entities.update_attributes(entity_id, attributes)
-            case EntityTypes.CLIMATE:
-                attributes[climate.Attributes.STATE] = state
-                self.api.configured_entities.update_attributes(entity_id, attributes)
-            case EntityTypes.COVER:
-                attributes[cover.Attributes.STATE] = state
-                self.api.configured_entities.update_attributes(entity_id, attributes)
-            case EntityTypes.LIGHT:
-                attributes[light.Attributes.STATE] = state
-                self.api.configured_entities.update_attributes(entity_id, attributes)
-            case EntityTypes.MEDIA_PLAYER:
-                attributes[media_player.Attributes.STATE] = state
-                self.api.configured_entities.update_attributes(entity_id, attributes)
-            case EntityTypes.REMOTE:
-                attributes[remote.Attributes.STATE] = state
-                self.api.configured_entities.update_attributes(entity_id, attributes)
-            case EntityTypes.SENSOR:
-                attributes[sensor.Attributes.STATE] = state
-                self.api.configured_entities.update_attributes(entity_id, attributes)
-            case EntityTypes.SWITCH:
-                attributes[switch.Attributes.STATE] = state
-                self.api.configured_entities.update_attributes(entity_id, attributes)
-            case EntityTypes.IR_EMITTER:  # Remote shares the same states as IR Emitter
-                attributes[remote.Attributes.STATE] = state
-                self.api.configured_entities.update_attributes(entity_id, attributes)
-            case EntityTypes.VOICE_ASSISTANT:
-                attributes[voice_assistant.Attributes.STATE] = state
-                self.api.configured_entities.update_attributes(entity_id, attributes)
+            state = self.map_device_state(device.state)
+        else:
+            # For other entity types, just mark as available
+            state = button.States.AVAILABLE
+
+        self.api.configured_entities.update_attributes(entity_id, {state_attr: state})
 
     # ========================================================================
     # Device Lifecycle Management
@@ -636,7 +893,9 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
 
         if connect:
             # start background connection task (non-blocking)
-            self._loop.create_task(device.connect())
+            self._run_in_background(
+                device.connect(), name=f"connect:{device.identifier}"
+            )
 
         self.register_available_entities(device_config, device)
 
@@ -655,12 +914,15 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
         :param device_config: Device configuration
         :return: True if device was added and connected successfully, False otherwise
         """
-        device = self._add_device_instance(device_config)
         device_id = self.get_device_id(device_config)
+        device = self._add_device_instance(device_config, device_id)
 
-        # Always connect and wait for completion
+        # Always connect and wait for completion. Only the connect counts
+        # against the concurrent connection limit, not entity registration.
         _LOG.debug("Connecting to device %s", device_id)
-        if not await device.connect():
+        async with self._connect_semaphore:
+            connected = await device.connect()
+        if not connected:
             _LOG.error("Failed to connect to device %s", device_id)
             return False
 
@@ -710,12 +972,14 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
             entity._api = self.api  # type: ignore[misc]
 
         # Remove if exists (handles re-registration)
-        if self.api.available_entities.contains(entity.id):
-            self.api.available_entities.remove(entity.id)
+        existing = self.api.available_entities.get(entity.id)
+        if existing is not entity:
+            if existing is not None:
+                self.api.available_entities.remove(entity.id)
 
-        # Add to available entities
-        self.api.available_entities.add(entity)
-        _LOG.info("Dynamically added entity: %s", entity.id)
+            # Add to available entities
+            self.api.available_entities.add(entity)
+            _LOG.info("Dynamically added entity: %s", entity.id)
 
     def filter_entities_by_type(
         self,
@@ -755,9 +1019,7 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
         :raises ValueError: If source is not valid
         """
         # Normalize entity_type to string
-        type_str = (
-            entity_type.value if isinstance(entity_type, EntityTypes) else entity_type
-        )
+        type_str = _ENTITY_TYPE_STR.get(entity_type, entity_type)
 
         # Normalize source to string
         source_str = source.value if isinstance(source, EntitySource) else source
@@ -812,7 +1074,11 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
         entities = self.create_entities(device_config, device)
 
         for entity in entities:
-            if self.api.available_entities.contains(entity.id):
+            existing = self.api.available_entities.get(entity.id)
+            if existing is entity:
+                # Same instance already registered, nothing to replace
+                continue
+            if existing is not None:
                 self.api.available_entities.remove(entity.id)
             self.api.available_entities.add(entity)
 
@@ -855,7 +1121,9 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
         """
         self.register_available_entities(device_config, device)
 
-    def _add_device_instance(self, device_config: ConfigT) -> DeviceT:
+    def _add_device_instance(
+        self, device_config: ConfigT, device_id: str | None = None
+    ) -> DeviceT:
         """
         Add a device instance without connecting or registering entities.
 
@@ -863,15 +1131,18 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
         to add a device, connect, and then register entities in sequence.
 
         :param device_config: Device configuration
+        :param device_id: Device identifier if the caller already resolved it
         :return: The created device instance
         """
-        device_id = self.get_device_id(device_config)
+        if device_id is None:
+            device_id = self.get_device_id(device_config)
 
-        if device_id in self._configured_devices:
+        existing = self._configured_devices.get(device_id)
+        if existing is not None:
             _LOG.debug(
                 "Device %s already exists, returning existing instance", device_id
             )
-            return self._configured_devices[device_id]
+            return existing
 
         _LOG.info(
             "Adding device instance: %s (%s)",
@@ -901,13 +1172,13 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
         """
         _LOG.debug("Device connected: %s", device_id)
 
-        if device_id not in self._configured_devices:
+        device = self._configured_devices.get(device_id)
+        if device is None:
             _LOG.warning("Device %s is not configured", device_id)
             return
 
         await self.api.set_device_state(ucapi.DeviceStates.CONNECTED)
 
-        device = self._configured_devices[device_id]
         state = (
             self.map_device_state(device.state)
             if device.state
@@ -917,53 +1188,20 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
         for entity_id in self.get_entity_ids_for_device(device_id):
             configured_entity = self.api.configured_entities.get(entity_id)
             if configured_entity is None:
-                _LOG.debug("Entity %s is not configured, ignoring", entity_id)
+                if _LOG.isEnabledFor(logging.DEBUG):
+                    _LOG.debug("Entity %s is not configured, ignoring", entity_id)
                 continue
 
-            # Update STATE attribute for the appropriate entity type
-            match configured_entity.entity_type:
-                case EntityTypes.BUTTON:
-                    self.api.configured_entities.update_attributes(
-                        entity_id, {button.Attributes.STATE: state}
-                    )
-                case EntityTypes.CLIMATE:
-                    self.api.configured_entities.update_attributes(
-                        entity_id, {climate.Attributes.STATE: state}
-                    )
-                case EntityTypes.COVER:
-                    self.api.configured_entities.update_attributes(
-                        entity_id, {cover.Attributes.STATE: state}
-                    )
-                case EntityTypes.LIGHT:
-                    self.api.configured_entities.update_attributes(
-                        entity_id, {light.Attributes.STATE: state}
-                    )
-                case EntityTypes.MEDIA_PLAYER:
-                    self.api.configured_entities.update_attributes(
-                        entity_id, {media_player.Attributes.STATE: state}
-                    )
-                case EntityTypes.REMOTE:
-                    self.api.configured_entities.update_attributes(
-                        entity_id, {remote.Attributes.STATE: state}
-                    )
-                case EntityTypes.SENSOR:
-                    self.api.configured_entities.update_attributes(
-                        entity_id, {sensor.Attributes.STATE: state}
-                    )
-                case EntityTypes.SWITCH:
-                    self.api.configured_entities.update_attributes(
-                        entity_id, {switch.Attributes.STATE: state}
-                    )
-                case (
-                    EntityTypes.IR_EMITTER
-                ):  # Remote shares the same states as IR Emitter
-                    self.api.configured_entities.update_attributes(
-                        entity_id, {remote.Attributes.STATE: state}
-                    )
-                case EntityTypes.VOICE_ASSISTANT:
-                    self.api.configured_entities.update_attributes(
-                        entity_id, {voice_assistant.Attributes.STATE: state}
-                    )
+            # Update STATE attribute for the appropriate entity type, unless the
+            # entity already reports this state
+            state_attr = _STATE_ATTR_BY_TYPE.get(configured_entity.entity_type)
+            if (
+                state_attr is not None
+                and (configured_entity.attributes or {}).get(state_attr) != state
+            ):
+                self.api.configured_entities.update_attributes(
+                    entity_id, {state_attr: state}
+                )
 
     async def on_device_disconnected(self, device_id: str) -> None:
         """
@@ -972,70 +1210,7 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
         :param device_id: Device identifier
         """
         _LOG.debug("Device disconnected: %s", device_id)
-
-        for entity_id in self.get_entity_ids_for_device(device_id):
-            configured_entity = self.api.configured_entities.get(entity_id)
-            if configured_entity is None:
-                continue
-
-            # Update STATE attribute for the appropriate entity type
-            match configured_entity.entity_type:
-                case EntityTypes.BUTTON:
-                    self.api.configured_entities.update_attributes(
-                        entity_id,
-                        {button.Attributes.STATE: media_player.States.UNAVAILABLE},
-                    )
-                case EntityTypes.CLIMATE:
-                    self.api.configured_entities.update_attributes(
-                        entity_id,
-                        {climate.Attributes.STATE: media_player.States.UNAVAILABLE},
-                    )
-                case EntityTypes.COVER:
-                    self.api.configured_entities.update_attributes(
-                        entity_id,
-                        {cover.Attributes.STATE: media_player.States.UNAVAILABLE},
-                    )
-                case EntityTypes.LIGHT:
-                    self.api.configured_entities.update_attributes(
-                        entity_id,
-                        {light.Attributes.STATE: media_player.States.UNAVAILABLE},
-                    )
-                case EntityTypes.MEDIA_PLAYER:
-                    self.api.configured_entities.update_attributes(
-                        entity_id,
-                        {
-                            media_player.Attributes.STATE: media_player.States.UNAVAILABLE
-                        },
-                    )
-                case EntityTypes.REMOTE:
-                    self.api.configured_entities.update_attributes(
-                        entity_id,
-                        {remote.Attributes.STATE: media_player.States.UNAVAILABLE},
-                    )
-                case EntityTypes.SENSOR:
-                    self.api.configured_entities.update_attributes(
-                        entity_id,
-                        {sensor.Attributes.STATE: media_player.States.UNAVAILABLE},
-                    )
-                case EntityTypes.SWITCH:
-                    self.api.configured_entities.update_attributes(
-                        entity_id,
-                        {switch.Attributes.STATE: media_player.States.UNAVAILABLE},
-                    )
-                case (
-                    EntityTypes.IR_EMITTER
-                ):  # Remote shares the same states as IR Emitter
-                    self.api.configured_entities.update_attributes(
-                        entity_id,
-                        {remote.Attributes.STATE: media_player.States.UNAVAILABLE},
-                    )
-                case EntityTypes.VOICE_ASSISTANT:
-                    self.api.configured_entities.update_attributes(
-                        entity_id,
-                        {
-                            voice_assistant.Attributes.STATE: media_player.States.UNAVAILABLE
-                        },
-                    )
+        self._mark_device_unavailable(device_id)
 
     async def on_device_connection_error(self, device_id: str, message: str) -> None:
         """
@@ -1045,70 +1220,35 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
         :param message: Error message
         """
         _LOG.error("[%s] Connection error: %s", device_id, message)
+        self._mark_device_unavailable(device_id)
+
+    def _mark_device_unavailable(self, device_id: str) -> None:
+        """
+        Set the STATE attribute of all configured entities of a device to UNAVAILABLE.
 
+        :param device_id: Device identifier
+        """
+        pending = self._pending_updates
         for entity_id in self.get_entity_ids_for_device(device_id):
+            # A coalesced update still waiting to be flushed predates the
+            # disconnect and must not overwrite UNAVAILABLE later
+            pending.pop(entity_id, None)
+
             configured_entity = self.api.configured_entities.get(entity_id)
             if configured_entity is None:
                 continue
 
-            # Update STATE attribute for the appropriate entity type
-            match configured_entity.entity_type:
-                case EntityTypes.BUTTON:
-                    self.api.configured_entities.update_attributes(
-                        entity_id,
-                        {button.Attributes.STATE: media_player.States.UNAVAILABLE},
-                    )
-                case EntityTypes.CLIMATE:
-                    self.api.configured_entities.update_attributes(
-                        entity_id,
-                        {climate.Attributes.STATE: media_player.States.UNAVAILABLE},
-                    )
-                case EntityTypes.COVER:
-                    self.api.configured_entities.update_attributes(
-                        entity_id,
-                        {cover.Attributes.STATE: media_player.States.UNAVAILABLE},
-                    )
-                case EntityTypes.LIGHT:
-                    self.api.configured_entities.update_attributes(
-                        entity_id,
-                        {light.Attributes.STATE: media_player.States.UNAVAILABLE},
-                    )
-                case EntityTypes.MEDIA_PLAYER:
-                    self.api.configured_entities.update_attributes(
-                        entity_id,
-                        {
-                            media_player.Attributes.STATE: media_player.States.UNAVAILABLE
-                        },
-                    )
-                case EntityTypes.REMOTE:
-                    self.api.configured_entities.update_attributes(
-                        entity_id,
-                        {remote.Attributes.STATE: media_player.States.UNAVAILABLE},
-                    )
-                case EntityTypes.SENSOR:
-                    self.api.configured_entities.update_attributes(
-                        entity_id,
-                        {sensor.Attributes.STATE: media_player.States.UNAVAILABLE},
-                    )
-                case EntityTypes.SWITCH:
-                    self.api.configured_entities.update_attributes(
-                        entity_id,
-                        {switch.Attributes.STATE: media_player.States.UNAVAILABLE},
-                    )
-                case (
-                    EntityTypes.IR_EMITTER
-                ):  # Remote shares the same states as IR Emitter
-                    self.api.configured_entities.update_attributes(
-                        entity_id,
-                        {remote.Attributes.STATE: media_player.States.UNAVAILABLE},
-                    )
-                case EntityTypes.VOICE_ASSISTANT:
-                    self.api.configured_entities.update_attributes(
-                        entity_id,
-                        {
-                            voice_assistant.Attributes.STATE: media_player.States.UNAVAILABLE
-                        },
-                    )
+            # Update STATE attribute for the appropriate entity type, unless the
+            # entity is already unavailable (e.g. repeated connection errors)
+            state_attr = _STATE_ATTR_BY_TYPE.get(configured_entity.entity_type)
+            if (
+                state_attr is not None
+                and (configured_entity.attributes or {}).get(state_attr)
+                != media_player.States.UNAVAILABLE
+            ):
+                self.api.configured_entities.update_attributes(
+                    entity_id, {state_attr: media_player.States.UNAVAILABLE}
+                )
 
     async def on_device_update(
         self,
@@ -1131,19 +1271,26 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
             _LOG.warning("[%s] Received None update, skipping", entity_id)
             return
 
-        # Process update for each entity belonging to this device
-        configured_entity = self.api.configured_entities.get(entity_id)
+        # Process update for each entity belonging to this device, remembering
+        # which collection it was found in for the final attribute update
+        entities = self.api.configured_entities
+        configured_entity = entities.get(entity_id)
         if configured_entity is None:
             # Try available entities if not in configured
-            configured_entity = self.api.available_entities.get(entity_id)
+            entities = self.api.available_entities
+            configured_entity = entities.get(entity_id)
             if configured_entity is None:
-                _LOG.debug(
-                    "[%s] Entity not found in configured or available entities, skipping",
-                    entity_id,
-                )
+                if _LOG.isEnabledFor(logging.DEBUG):
+                    _LOG.debug(
+                        "[%s] Entity not found in configured or available entities, skipping",
+                        entity_id,
+                    )
                 return
 
-        _LOG.debug("[%s] Device update: %s", entity_id, update)
+        # Checked once per update so disabled debug logging costs nothing more
+        debug_enabled = _LOG.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            _LOG.debug("[%s] Device update: %s", entity_id, update)
 
         # Check if this entity inherits from our framework Entity ABC
         # If so, use its custom methods for state mapping and attribute updates
@@ -1152,211 +1299,58 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
             cast(FrameworkEntity, configured_entity) if has_custom_behavior else None
         )
 
-        attributes: dict[str, Any] = {}
+        entity_type = configured_entity.entity_type
+        key_map = _UPDATE_KEY_MAP.get(entity_type)
+        if key_map is None:
+            # Unknown entity type - log warning
+            _LOG.warning(
+                "[%s] Unknown entity type: %s for entity %s",
+                entity_id,
+                entity_type,
+                entity_id,
+            )
+            return
 
-        match configured_entity.entity_type:
-            case EntityTypes.BUTTON:
-                # Button entities: STATE
-                if button.Attributes.STATE.value in update:
-                    state_value = update[button.Attributes.STATE.value]
-                    if has_custom_behavior and framework_entity:
-                        state = framework_entity.map_entity_states(state_value)
-                    else:
-                        state = self.map_device_state(state_value)
-                    attributes[button.Attributes.STATE] = state
-
-            case EntityTypes.CLIMATE:
-                # Climate entities: STATE, CURRENT_TEMPERATURE, TARGET_TEMPERATURE,
-                # TARGET_TEMPERATURE_HIGH, TARGET_TEMPERATURE_LOW, FAN_MODE
-                for attr in [
-                    climate.Attributes.STATE,
-                    climate.Attributes.CURRENT_TEMPERATURE,
-                    climate.Attributes.TARGET_TEMPERATURE,
-                    climate.Attributes.TARGET_TEMPERATURE_HIGH,
-                    climate.Attributes.TARGET_TEMPERATURE_LOW,
-                    climate.Attributes.FAN_MODE,
-                ]:
-                    if attr.value in update:
-                        value = update[attr.value]
-                        # Apply state mapping for STATE attribute
-                        if attr == climate.Attributes.STATE:
-                            if has_custom_behavior and framework_entity:
-                                value = framework_entity.map_entity_states(value)
-                            else:
-                                value = self.map_device_state(value)
-                        attributes[attr] = value
-
-            case EntityTypes.COVER:
-                # Cover entities: STATE, POSITION, TILT_POSITION
-                for attr in [
-                    cover.Attributes.STATE,
-                    cover.Attributes.POSITION,
-                    cover.Attributes.TILT_POSITION,
-                ]:
-                    if attr.value in update:
-                        value = update[attr.value]
-                        # Apply state mapping for STATE attribute
-                        if attr == cover.Attributes.STATE:
-                            if has_custom_behavior and framework_entity:
-                                value = framework_entity.map_entity_states(value)
-                            else:
-                                value = self.map_device_state(value)
-                        attributes[attr] = value
-
-            case EntityTypes.LIGHT:
-                # Light entities: STATE, HUE, SATURATION, BRIGHTNESS, COLOR_TEMPERATURE
-                for attr in [
-                    light.Attributes.STATE,
-                    light.Attributes.HUE,
-                    light.Attributes.SATURATION,
-                    light.Attributes.BRIGHTNESS,
-                    light.Attributes.COLOR_TEMPERATURE,
-                ]:
-                    if attr.value in update:
-                        value = update[attr.value]
-                        # Apply state mapping for STATE attribute
-                        if attr == light.Attributes.STATE:
-                            if has_custom_behavior and framework_entity:
-                                value = framework_entity.map_entity_states(value)
-                            else:
-                                value = self.map_device_state(value)
-                        attributes[attr] = value
-
-            case EntityTypes.MEDIA_PLAYER:
-                # Media player entities: STATE, VOLUME, MUTED, MEDIA_DURATION,
-                # MEDIA_POSITION, MEDIA_TYPE, MEDIA_IMAGE_URL, MEDIA_TITLE,
-                # MEDIA_ARTIST, MEDIA_ALBUM, REPEAT, SHUFFLE, SOURCE, SOURCE_LIST,
-                # SOUND_MODE, SOUND_MODE_LIST
-
-                # Check if state is being updated and is OFF
-                state_value = None
-                if media_player.Attributes.STATE.value in update:
-                    raw_state = update[media_player.Attributes.STATE.value]
-                    if has_custom_behavior and framework_entity:
-                        state_value = framework_entity.map_entity_states(raw_state)
-                    else:
-                        state_value = self.map_device_state(raw_state)
-                    attributes[media_player.Attributes.STATE] = state_value
-
-                # If clear_media_when_off is True and state is OFF, clear all media attributes
-                if clear_media_when_off and state_value == media_player.States.OFF:
-                    # Clear all media-related attributes (use empty strings for string fields, 0 for numbers)
-                    attributes[media_player.Attributes.MEDIA_DURATION] = 0
-                    attributes[media_player.Attributes.MEDIA_POSITION] = 0
-                    attributes[media_player.Attributes.MEDIA_TYPE] = ""
-                    attributes[media_player.Attributes.MEDIA_IMAGE_URL] = ""
-                    attributes[media_player.Attributes.MEDIA_TITLE] = ""
-                    attributes[media_player.Attributes.MEDIA_ARTIST] = ""
-                    attributes[media_player.Attributes.MEDIA_ALBUM] = ""
-                    attributes[media_player.Attributes.SOURCE] = ""
-                    attributes[media_player.Attributes.SOUND_MODE] = ""
-                else:
-                    # Process remaining attributes normally
-                    for attr in [
-                        media_player.Attributes.VOLUME,
-                        media_player.Attributes.MUTED,
-                        media_player.Attributes.MEDIA_DURATION,
-                        media_player.Attributes.MEDIA_POSITION,
-                        media_player.Attributes.MEDIA_POSITION_UPDATED_AT,
-                        media_player.Attributes.MEDIA_TYPE,
-                        media_player.Attributes.MEDIA_IMAGE_URL,
-                        media_player.Attributes.MEDIA_TITLE,
-                        media_player.Attributes.MEDIA_ARTIST,
-                        media_player.Attributes.MEDIA_ALBUM,
-                        media_player.Attributes.REPEAT,
-                        media_player.Attributes.SHUFFLE,
-                        media_player.Attributes.SOURCE,
-                        media_player.Attributes.SOURCE_LIST,
-                        media_player.Attributes.SOUND_MODE,
-                        media_player.Attributes.SOUND_MODE_LIST,
-                    ]:
-                        if attr.value in update:
-                            attributes[attr] = update[attr.value]
-
-            case EntityTypes.REMOTE:
-                # Remote entities: STATE
-                if remote.Attributes.STATE.value in update:
-                    state_value = update[remote.Attributes.STATE.value]
-                    if has_custom_behavior and framework_entity:
-                        state = framework_entity.map_entity_states(state_value)
-                    else:
-                        state = self.map_device_state(state_value)
-                    attributes[remote.Attributes.STATE] = state
-
-            case EntityTypes.SENSOR:
-                # Sensor entities: STATE, VALUE, UNIT
-                for attr in [
-                    sensor.Attributes.STATE,
-                    sensor.Attributes.VALUE,
-                    sensor.Attributes.UNIT,
-                ]:
-                    if attr.value in update:
-                        value = update[attr.value]
-                        # Apply state mapping for STATE attribute
-                        if attr == sensor.Attributes.STATE:
-                            if has_custom_behavior and framework_entity:
-                                value = framework_entity.map_entity_states(value)
-                            else:
-                                value = self.map_device_state(value)
-                        attributes[attr] = value
-
-            case EntityTypes.SWITCH:
-                # Switch entities: STATE
-                if switch.Attributes.STATE.value in update:
-                    state_value = update[switch.Attributes.STATE.value]
-                    if has_custom_behavior and framework_entity:
-                        state = framework_entity.map_entity_states(state_value)
-                    else:
-                        state = self.map_device_state(state_value)
-                    attributes[switch.Attributes.STATE] = state
-
-            case EntityTypes.IR_EMITTER:
-                # IR Emitter entities: STATE (Shares same state mapping as Remote)
-                if remote.Attributes.STATE.value in update:
-                    state_value = update[remote.Attributes.STATE.value]
-                    if has_custom_behavior and framework_entity:
-                        state = framework_entity.map_entity_states(state_value)
-                    else:
-                        state = self.map_device_state(state_value)
-                    attributes[remote.Attributes.STATE] = state
-
-            case EntityTypes.VOICE_ASSISTANT:
-                # Voice Assistant entities: STATE
-                if voice_assistant.Attributes.STATE.value in update:
-                    state_value = update[voice_assistant.Attributes.STATE.value]
-                    if has_custom_behavior and framework_entity:
-                        state = framework_entity.map_entity_states(state_value)
-                    else:
-                        state = self.map_device_state(state_value)
-                    attributes[voice_assistant.Attributes.STATE] = state
-
-            case _:
-                # Unknown entity type - log warning
-                _LOG.warning(
-                    "[%s] Unknown entity type: %s for entity %s",
-                    entity_id,
-                    configured_entity.entity_type,
-                    entity_id,
-                )
+        recognized = update.keys() & key_map.keys()
+        if not recognized:
+            # Nothing this entity type understands, e.g. a noisy device push
+            return
 
-        # Update entity attributes if any were found
-        if attributes:
-            if self.api.configured_entities.contains(entity_id):
-                if has_custom_behavior and framework_entity:
-                    # Use framework entity's update method which handles filtering
-                    framework_entity.update_attributes(attributes)
-                else:
-                    # Use direct API update for standard entities
-                    self.api.configured_entities.update_attributes(
-                        entity_id, attributes
-                    )
-            elif self.api.available_entities.contains(entity_id):
-                if has_custom_behavior and framework_entity:
-                    # Use framework entity's update method which handles filtering
-                    framework_entity.update_attributes(attributes)
-                else:
-                    # Use direct API update for standard entities
-                    self.api.available_entities.update_attributes(entity_id, attributes)
+        map_state = (
+            framework_entity.map_entity_states
+            if has_custom_behavior and framework_entity
+            else self.map_device_state
+        )
+        attributes: dict[str, Any] = {}
+        for key in recognized:
+            attr, is_state = key_map[key]
+            value = update[key]
+            # Apply state mapping for STATE attributes
+            attributes[attr] = map_state(value) if is_state else value
+
+        # If clear_media_when_off is True and state is OFF, clear all media attributes
+        if (
+            clear_media_when_off
+            and entity_type == EntityTypes.MEDIA_PLAYER
+            and attributes.get(media_player.Attributes.STATE) == media_player.States.OFF
+        ):
+            # Clear all media-related attributes
+            attributes = {media_player.Attributes.STATE: media_player.States.OFF}
+            attributes.update(_MEDIA_OFF_CLEAR)
+
+        # Update entity attributes (at least one recognized key was present)
+        if has_custom_behavior and framework_entity:
+            # Use framework entity's update method which handles filtering
+            apply_update = framework_entity.update_attributes
+        else:
+            # Use direct API update for standard entities
+            apply_update = partial(entities.update_attributes, entity_id)
+
+        if self.update_coalesce_delay > 0:
+            self._queue_entity_update(entity_id, apply_update, attributes)
+        else:
+            apply_update(attributes)
+        if debug_enabled:
             _LOG.debug(
                 "[%s] Updated entity %s with attributes: %s",
                 entity_id,
@@ -1364,6 +1358,51 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
                 attributes,
             )
 
+    def _queue_entity_update(
+        self,
+        entity_id: str,
+        apply_update: Callable[[dict[str, Any]], Any],
+        attributes: dict[str, Any],
+    ) -> None:
+        """
+        Merge an entity attribute update into the pending batch.
+
+        Later values for the same attribute win. The batch is flushed once
+        update_coalesce_delay seconds after the first queued update.
+
+        :param entity_id: Entity identifier
+        :param apply_update: Callable applying an attributes dict to the entity
+        :param attributes: Attributes to merge
+        """
+        pending = self._pending_updates.get(entity_id)
+        if pending is None:
+            self._pending_updates[entity_id] = (apply_update, dict(attributes))
+        else:
+            pending[1].update(attributes)
+
+        if self._flush_handle is None:
+            self._flush_handle = self._loop.call_later(
+                self.update_coalesce_delay, self.flush_pending_updates
+            )
+
+    def flush_pending_updates(self) -> None:
+        """
+        Send all coalesced entity attribute updates now.
+
+        Only relevant when update_coalesce_delay is set. Call this before
+        shutting down to avoid dropping the last updates.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending_updates = self._pending_updates, {}
+        for entity_id, (apply_update, attributes) in pending.items():
+            try:
+                apply_update(attributes)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                _LOG.error("[%s] Failed to apply coalesced update: %s", entity_id, err)
+
     def get_device_config(self, device_id: str) -> ConfigT | None:
         """
         Get device configuration for the given device ID.
@@ -1397,7 +1436,7 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
         :return: Device identifier
         :raises AttributeError: If no valid ID attribute is found
         """
-        value = _get_first_valid_attr(device_config, *_DEVICE_ID_ATTRIBUTES)
+        value = _get_first_valid_attr(device_config, _DEVICE_ID_ATTRIBUTES)
         if value:
             return value
 
@@ -1417,7 +1456,7 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
         :return: Device name
         :raises AttributeError: If no valid name attribute is found
         """
-        value = _get_first_valid_attr(device_config, *_DEVICE_NAME_ATTRIBUTES)
+        value = _get_first_valid_attr(device_config, _DEVICE_NAME_ATTRIBUTES)
         if value:
             return value
 
@@ -1437,7 +1476,7 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
         :return: Device address
         :raises AttributeError: If no valid address attribute is found
         """
-        value = _get_first_valid_attr(device_config, *_DEVICE_ADDRESS_ATTRIBUTES)
+        value = _get_first_valid_attr(device_config, _DEVICE_ADDRESS_ATTRIBUTES)
         if value:
             return value
 
@@ -1624,8 +1663,9 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
         if not entity_id:
             return None
 
-        # Check if separator exists in entity_id
-        if self.entity_id_separator not in entity_id:
+        # Only the first field is needed: "entity_type.device_id[.sub_device_id]"
+        entity_type, sep, _ = entity_id.partition(self.entity_id_separator)
+        if not sep:
             raise ValueError(
                 f"Entity ID '{entity_id}' does not contain the expected separator "
                 f"'{self.entity_id_separator}'. Either your entity IDs are not using the "
@@ -1633,11 +1673,7 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
                 f"your format, or override entity_type_from_entity_id() to parse your custom format."
             )
 
-        # Split on separator: "entity_type.device_id" or "entity_type.device_id.entity_id"
-        parts = entity_id.split(self.entity_id_separator)
-
-        # First part is always the entity_type
-        return parts[0] if parts else None
+        return entity_type
 
     def device_from_entity_id(self, entity_id: str) -> str | None:
         """
@@ -1670,23 +1706,19 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
         if not entity_id:
             return None
 
-        # Check if separator exists in entity_id
-        if self.entity_id_separator not in entity_id:
+        separator = self.entity_id_separator
+        _, sep, rest = entity_id.partition(separator)
+        if not sep:
             raise ValueError(
                 f"Entity ID '{entity_id}' does not contain the expected separator "
-                f"'{self.entity_id_separator}'. Either your entity IDs are not using the "
+                f"'{separator}'. Either your entity IDs are not using the "
                 f"standard format, or you need to set driver.entity_id_separator to match "
                 f"your format, or override device_from_entity_id() to parse your custom format."
             )
 
-        # Split on separator: "entity_type.device_id" or "entity_type.device_id.entity_id"
-        parts = entity_id.split(self.entity_id_separator)
-
-        if len(parts) < 2:
-            return None
-
-        # Second part is always the device_id
-        return parts[1]
+        # Second field is always the device_id: "entity_type.device_id[.sub_device_id]"
+        device_id, _, _ = rest.partition(separator)
+        return device_id
 
     def sub_device_from_entity_id(self, entity_id: str) -> str | None:
         """
@@ -1710,9 +1742,11 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
         Example custom override:
             def sub_device_from_entity_id(self, entity_id: str) -> str | None:
                 # For custom format: "deviceid_zonename"
-                if "_" in entity_id:
-                    return entity_id.split("_", 1)[1]  # Returns "zone1", "zone2"
-                return None
+                _, sep, zone = entity_id.partition("_")
+                return zone if sep else None  # Returns "zone1", "zone2"
+
+        Prefer str.partition over a membership test plus split: it scans the
+        string once and allocates no list.
 
         :param entity_id: Entity identifier (e.g., "light.hub_1.bedroom")
         :return: Sub-device identifier or None
@@ -1721,25 +1755,20 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
         if not entity_id:
             return None
 
-        # Check if separator exists in entity_id
-        if self.entity_id_separator not in entity_id:
+        separator = self.entity_id_separator
+        _, sep, rest = entity_id.partition(separator)
+        if not sep:
             raise ValueError(
                 f"Entity ID '{entity_id}' does not contain the expected separator "
-                f"'{self.entity_id_separator}'. Either your entity IDs are not using the "
+                f"'{separator}'. Either your entity IDs are not using the "
                 f"standard format, or you need to set driver.entity_id_separator to match "
                 f"your format, or override sub_device_from_entity_id() to parse your custom format."
             )
 
-        # Split on separator: "entity_type.device_id" or "entity_type.device_id.sub_device_id"
-        parts = entity_id.split(
-            self.entity_id_separator, 2
-        )  # Split into at most 3 parts
-
-        # Return everything after the second separator if present, None otherwise
-        if len(parts) >= 3:
-            return parts[2]  # This will be "sub_device_id" or "sub.device.with.dots"
-
-        return None
+        # Everything after the second separator is the sub-device ID, which may
+        # itself contain separators: "entity_type.device_id.sub.device.with.dots"
+        _, sep, sub_device_id = rest.partition(separator)
+        return sub_device_id if sep else None
 
     def get_entity_ids_for_device(self, device_id: str) -> list[str]:
         """
@@ -1770,22 +1799,41 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
         :param device_id: Device identifier
         :return: List of entity identifiers for this device
         """
-        # Query all entities (both available and configured) and filter by device_id
-        entity_ids = set()  # Use set to avoid duplicates
-
-        # Check available entities
-        for entity in self.api.available_entities.get_all():
-            entity_device_id = self.device_from_entity_id(entity["entity_id"])
-            if entity_device_id == device_id:
-                entity_ids.add(entity["entity_id"])
-
-        # Check configured entities
-        for entity in self.api.configured_entities.get_all():
-            entity_device_id = self.device_from_entity_id(entity["entity_id"])
-            if entity_device_id == device_id:
-                entity_ids.add(entity["entity_id"])
+        # Query all entities (both available and configured) and filter by device_id.
+        # Entities present in both collections are only parsed once, so matches
+        # can be collected straight into the returned list.
+        entity_ids: list[str] = []
+        seen: set[str] = set()
+        parse = self.device_from_entity_id
+        # With the default parser the device ID is the field after the first
+        # separator, which can be matched with C-level string checks instead of
+        # a parse per entity. Overridden parsers are always called.
+        standard_format = (
+            type(self).device_from_entity_id
+            is BaseIntegrationDriver.device_from_entity_id
+        )
+        separator = self.entity_id_separator
+        device_prefix = device_id + separator
+
+        for entity in chain(
+            self.api.available_entities.get_all(),
+            self.api.configured_entities.get_all(),
+        ):
+            entity_id = entity["entity_id"]
+            if entity_id in seen:
+                continue
+            seen.add(entity_id)
+            if standard_format:
+                _, found, rest = entity_id.partition(separator)
+                matches = found and (
+                    rest == device_id or rest.startswith(device_prefix)
+                )
+            else:
+                matches = parse(entity_id) == device_id
+            if matches:
+                entity_ids.append(entity_id)
 
-        return list(entity_ids)
+        return entity_ids
 
     # ========================================================================
     # Utility Methods
@@ -1797,15 +1845,19 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
 
         :param device_id: Device identifier
         """
-        if device_id in self._configured_devices:
+        device = self._configured_devices.pop(device_id, None)
+        if device is not None:
             _LOG.info("Removing device %s", device_id)
-            device = self._configured_devices.pop(device_id)
             device.events.remove_all_listeners()
 
-            # Remove all associated entities
+            # Remove all associated entities (ucapi has no batch removal)
+            remove_configured = self.api.configured_entities.remove
+            remove_available = self.api.available_entities.remove
+            pending = self._pending_updates
             for entity_id in self.get_entity_ids_for_device(device_id):
-                self.api.configured_entities.remove(entity_id)
-                self.api.available_entities.remove(entity_id)
+                remove_configured(entity_id)
+                remove_available(entity_id)
+                pending.pop(entity_id, None)
         else:
             _LOG.warning("Device %s not found in configured devices", device_id)
 
@@ -1815,6 +1867,10 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
         for device in self._configured_devices.values():
             device.events.remove_all_listeners()
         self._configured_devices.clear()
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending_updates.clear()
         self.api.configured_entities.clear()
         self.api.available_entities.clear()
 
@@ -1835,11 +1891,15 @@ class BaseIntegrationDriver(Generic[DeviceT, ConfigT]):
 
         :param device_config: Device configuration that was added
         """
-        _LOG.debug("Device added: %s", self.get_device_id(device_config))
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug("Device added: %s", self.get_device_id(device_config))
 
         if self._require_connection_before_registry:
-            # Schedule async device addition as a background task
-            self._loop.create_task(self.async_add_configured_device(device_config))
+            # Schedule async device addition as a background task. The task name
+            # is static so resolving the device ID cannot fail before scheduling.
+            self._run_in_background(
+                self.async_add_configured_device(device_config), name="add_device"
+            )
         else:
             self.add_configured_device(device_config, connect=False)
 
@@ -7,6 +7,7 @@ Common entity interface for UC API integrations.
 
 from abc import ABC
 from dataclasses import asdict, is_dataclass
+from functools import lru_cache
 from typing import Any, cast
 from ucapi import (
     IntegrationAPI,
@@ -36,6 +37,42 @@ _ENTITY_ATTRIBUTES_MAP = {
 }
 
 
+# Upper-cased device state strings and the media_player.States they map to
+_STATE_MAP: dict[str, media_player.States] = {
+    "UNAVAILABLE": media_player.States.UNAVAILABLE,
+    "UNKNOWN": media_player.States.UNKNOWN,
+    "ON": media_player.States.ON,
+    "MENU": media_player.States.ON,
+    "IDLE": media_player.States.ON,
+    "ACTIVE": media_player.States.ON,
+    "READY": media_player.States.ON,
+    "OFF": media_player.States.OFF,
+    "POWER_OFF": media_player.States.OFF,
+    "POWERED_OFF": media_player.States.OFF,
+    "STOPPED": media_player.States.OFF,
+    "PLAYING": media_player.States.PLAYING,
+    "PLAY": media_player.States.PLAYING,
+    "SEEKING": media_player.States.PLAYING,
+    "PAUSED": media_player.States.PAUSED,
+    "PAUSE": media_player.States.PAUSED,
+    "STANDBY": media_player.States.STANDBY,
+    "SLEEP": media_player.States.STANDBY,
+    "BUFFERING": media_player.States.BUFFERING,
+    "LOADING": media_player.States.BUFFERING,
+}
+
+
+@lru_cache(maxsize=256)
+def _map_state_str(state: str) -> media_player.States:
+    """
+    Map a raw device state string to media_player.States (cached).
+
+    :param state: Device state string, any case
+    :return: Media player state
+    """
+    return _STATE_MAP.get(state.upper(), media_player.States.UNKNOWN)
+
+
 def map_state_to_media_player(device_state: Any) -> media_player.States:
     """
     Map a device-specific state to media_player.States.
@@ -53,28 +90,10 @@ def map_state_to_media_player(device_state: Any) -> media_player.States:
     if isinstance(device_state, media_player.States):
         return device_state
 
-    # Convert to uppercase string for comparison
-    state_str = str(device_state).upper()
-
-    match state_str:
-        case "UNAVAILABLE":
-            return media_player.States.UNAVAILABLE
-        case "UNKNOWN":
-            return media_player.States.UNKNOWN
-        case "ON" | "MENU" | "IDLE" | "ACTIVE" | "READY":
-            return media_player.States.ON
-        case "OFF" | "POWER_OFF" | "POWERED_OFF" | "STOPPED":
-            return media_player.States.OFF
-        case "PLAYING" | "PLAY" | "SEEKING":
-            return media_player.States.PLAYING
-        case "PAUSED" | "PAUSE":
-            return media_player.States.PAUSED
-        case "STANDBY" | "SLEEP":
-            return media_player.States.STANDBY
-        case "BUFFERING" | "LOADING":
-            return media_player.States.BUFFERING
-        case _:
-            return media_player.States.UNKNOWN
+    # Devices tend to repeat the same few state strings, so the mapping is cached
+    if type(device_state) is str:
+        return _map_state_str(device_state)
+    return _map_state_str(str(device_state))
 
 
 # pylint: disable=R0903